@@ -0,0 +1,140 @@
+"""Benchmark rerun per tab secara headless dengan ``streamlit.testing.v1.AppTest``.
+
+Untuk setiap tab di menu utama, script memilih tab itu lewat state option_menu
+lalu mencatat wall time per rerun, peak memory (tracemalloc) dan ukuran
+payload JSON semua chart Plotly yang dikirim.
+
+    python benchmarks/bench_tabs.py --repeat 10 --output bench_results.json
+    python benchmarks/bench_tabs.py --compare baseline.json --threshold 0.25
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from dashboard.tabs import TABS  # noqa: E402
+
+APP_PATH = ROOT_DIR / 'app.py'
+METRICS = ('wall_ms', 'peak_mem_kb', 'payload_bytes')
+
+
+def _select(at, tab):
+    # Sama seperti klik di option_menu: ubah nilai komponen, lalu rerun
+    at.session_state['main_menu'] = tab
+    start = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - start) * 1000
+    if at.exception:
+        raise RuntimeError(f'{tab}: {at.exception[0].value}')
+    return elapsed
+
+
+def _payload(at):
+    charts = at.get('plotly_chart')
+    return len(charts), sum(len(c.proto.spec) for c in charts)
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, round(q * (len(values) - 1)))]
+
+
+def run(tabs, repeat, timeout=60):
+    at = AppTest.from_file(str(APP_PATH), default_timeout=timeout)
+    at.run()
+    results = {}
+    for tab in tabs:
+        # Kunjungan pertama (cache figure masih kosong) dicatat terpisah
+        first_ms = _select(at, tab)
+        runs = [_select(at, tab) for _ in range(repeat)]
+
+        tracemalloc.start()
+        _select(at, tab)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        charts, payload = _payload(at)
+        results[tab] = {
+            'first_ms': first_ms,
+            'wall_ms': statistics.median(runs),
+            'wall_ms_p95': _percentile(runs, 0.95),
+            'wall_ms_min': min(runs),
+            'runs_ms': runs,
+            'peak_mem_kb': peak / 1024,
+            'charts': charts,
+            'payload_bytes': payload,
+        }
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': repeat,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'tabs': results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Daftar regresi: metrik yang naik lebih dari ``threshold`` (rasio) dari baseline."""
+    regressions = []
+    for tab, base in baseline['tabs'].items():
+        cur = current['tabs'].get(tab)
+        if cur is None:
+            continue
+        for metric in METRICS:
+            if not base.get(metric):
+                continue
+            ratio = cur[metric] / base[metric]
+            if ratio > 1 + threshold:
+                regressions.append((tab, metric, base[metric], cur[metric], ratio))
+    return regressions
+
+
+def _print_table(result):
+    print(f"{'tab':<18}{'first ms':>10}{'median ms':>11}{'p95 ms':>9}{'peak KB':>10}{'payload B':>11}")
+    for tab, r in result['tabs'].items():
+        print(f"{tab:<18}{r['first_ms']:>10.1f}{r['wall_ms']:>11.1f}{r['wall_ms_p95']:>9.1f}"
+              f"{r['peak_mem_kb']:>10.0f}{r['payload_bytes']:>11}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark rerun per tab (AppTest, headless)')
+    parser.add_argument('--repeat', type=int, default=5, help='jumlah rerun per tab')
+    parser.add_argument('--tabs', nargs='*', default=list(TABS), help='tab yang diukur (default: semua)')
+    parser.add_argument('--output', default='bench_results.json', help='file JSON hasil')
+    parser.add_argument('--compare', metavar='BASELINE', help='JSON baseline untuk deteksi regresi')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='kenaikan relatif maksimum sebelum dianggap regresi (default 0.25)')
+    args = parser.parse_args(argv)
+
+    unknown = [t for t in args.tabs if t not in TABS]
+    if unknown:
+        parser.error(f"tab tidak dikenal: {', '.join(unknown)}")
+
+    result = run(args.tabs, args.repeat)
+    Path(args.output).write_text(json.dumps(result, indent=2))
+    _print_table(result)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(result, baseline, args.threshold)
+        for tab, metric, base, cur, ratio in regressions:
+            print(f'REGRESI {tab} {metric}: {base:.1f} -> {cur:.1f} ({ratio:.2f}x)')
+        if regressions:
+            return 1
+        print(f'Tidak ada regresi di atas {args.threshold:.0%} terhadap {args.compare}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
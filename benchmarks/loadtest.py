@@ -0,0 +1,223 @@
+"""Load test sesi paralel terhadap server Streamlit lokal.
+
+Script menjalankan ``streamlit run app.py`` di port lokal. Lalu untuk setiap
+tingkat konkurensi ia membuka N sesi lewat protokol websocket Streamlit
+(``/_stcore/stream``). Setiap sesi berpindah tab lewat komponen option_menu
+dengan laju tertentu. Per tingkat dilaporkan latensi rerun p50/p95/p99,
+throughput, serta RSS dan CPU proses server.
+
+    python benchmarks/loadtest.py --sessions 1 5 10 25 --duration 30 --rate 0.5
+    python benchmarks/loadtest.py --url ws://127.0.0.1:8501 --sessions 10   # server yang sudah jalan
+
+Server yang dijalankan sendiri mematikan proteksi XSRF. Untuk ``--url``,
+server target juga harus dijalankan dengan ``--server.enableXsrfProtection false``.
+RSS/CPU dibaca dari ``/proc``, jadi hanya tersedia di Linux.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from dashboard.tabs import TABS  # noqa: E402
+
+MENU_COMPONENT = 'streamlit_option_menu.option_menu'
+
+
+class Session:
+    def __init__(self, url):
+        self.url = url
+        self.menu_id = None
+        self.ws = None
+
+    async def connect(self):
+        self.ws = await websockets.connect(f'{self.url}/_stcore/stream', subprotocols=['streamlit'],
+                                           max_size=None)
+        await self.rerun()
+        if self.menu_id is None:
+            raise RuntimeError('option_menu tidak ditemukan di output app')
+
+    async def rerun(self, tab=None):
+        msg = BackMsg()
+        msg.rerun_script.query_string = ''
+        if tab is not None:
+            # Sama seperti klik di option_menu: kirim nilai komponen bersama rerun
+            widget = msg.rerun_script.widget_states.widgets.add()
+            widget.id = self.menu_id
+            widget.json_value = json.dumps(tab)
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await self.ws.recv())
+            kind = fwd.WhichOneof('type')
+            if kind == 'delta' and fwd.delta.WhichOneof('type') == 'new_element':
+                element = fwd.delta.new_element
+                if (element.WhichOneof('type') == 'component_instance'
+                        and element.component_instance.component_name == MENU_COMPONENT):
+                    self.menu_id = element.component_instance.id
+            elif kind == 'script_finished':
+                return time.perf_counter() - start
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+
+class ProcSampler:
+    """Sampel RSS dan CPU proses server dari /proc/<pid>."""
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.rss = []
+        self.cpu = []
+
+    def sample(self):
+        """(detik CPU kumulatif, RSS dalam byte) proses saat ini."""
+        stat = Path(f'/proc/{self.pid}/stat').read_text().rsplit(')', 1)[1].split()
+        cpu_seconds = (int(stat[11]) + int(stat[12])) / os.sysconf('SC_CLK_TCK')
+        rss = int(stat[21]) * os.sysconf('SC_PAGE_SIZE')
+        return cpu_seconds, rss
+
+    async def run(self, interval=0.5):
+        if self.pid is None or not Path(f'/proc/{self.pid}').exists():
+            return
+        last_cpu, _ = self.sample()
+        last_t = time.monotonic()
+        while True:
+            await asyncio.sleep(interval)
+            cpu, rss = self.sample()
+            now = time.monotonic()
+            self.cpu.append((cpu - last_cpu) / (now - last_t) * 100)
+            self.rss.append(rss)
+            last_cpu, last_t = cpu, now
+
+
+async def _drive(session, tabs, rate, deadline, rng, latencies, errors):
+    tab = None
+    while time.monotonic() < deadline:
+        await asyncio.sleep(rng.expovariate(rate))
+        tab = rng.choice([t for t in tabs if t != tab])
+        try:
+            latencies.append(await session.rerun(tab))
+        except Exception as exc:  # koneksi putus, timeout, dll.
+            errors.append(repr(exc))
+            return
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, round(q * (len(values) - 1)))]
+
+
+async def run_level(url, n_sessions, duration, rate, tabs, pid, seed):
+    sessions = [Session(url) for _ in range(n_sessions)]
+    await asyncio.gather(*(s.connect() for s in sessions))
+
+    sampler = ProcSampler(pid)
+    sampler_task = asyncio.create_task(sampler.run())
+    latencies, errors = [], []
+    deadline = time.monotonic() + duration
+    started = time.monotonic()
+    await asyncio.gather(*(
+        _drive(s, tabs, rate, deadline, random.Random(seed + i), latencies, errors)
+        for i, s in enumerate(sessions)
+    ))
+    elapsed = time.monotonic() - started
+    sampler_task.cancel()
+    await asyncio.gather(*(s.close() for s in sessions), return_exceptions=True)
+
+    result = {'sessions': n_sessions, 'reruns': len(latencies), 'errors': len(errors),
+              'throughput_rps': len(latencies) / elapsed}
+    if latencies:
+        ms = [x * 1000 for x in latencies]
+        result.update(p50_ms=_percentile(ms, 0.50), p95_ms=_percentile(ms, 0.95),
+                      p99_ms=_percentile(ms, 0.99), mean_ms=statistics.mean(ms))
+    if sampler.rss:
+        result.update(rss_max_mb=max(sampler.rss) / 2**20, rss_end_mb=sampler.rss[-1] / 2**20,
+                      cpu_mean_pct=statistics.mean(sampler.cpu), cpu_max_pct=max(sampler.cpu))
+    return result
+
+
+def start_server(port, app=ROOT_DIR / 'app.py'):
+    app = Path(app)
+    cmd = [sys.executable, '-m', 'streamlit', 'run', str(app),
+           '--server.headless', 'true', '--server.port', str(port),
+           '--server.enableXsrfProtection', 'false', '--browser.gatherUsageStats', 'false']
+    proc = subprocess.Popen(cmd, cwd=app.parent, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    health = f'http://127.0.0.1:{port}/_stcore/health'
+    for _ in range(120):
+        if proc.poll() is not None:
+            raise RuntimeError('server Streamlit berhenti saat start')
+        try:
+            with urllib.request.urlopen(health, timeout=1) as resp:
+                if resp.status == 200:
+                    return proc
+        except OSError:
+            time.sleep(0.5)
+    proc.terminate()
+    raise RuntimeError('server Streamlit tidak siap dalam 60 detik')
+
+
+def _print_row(r):
+    print(f"{r['sessions']:>8}{r['reruns']:>8}{r['errors']:>7}{r['throughput_rps']:>9.1f}"
+          f"{r.get('p50_ms', 0):>9.0f}{r.get('p95_ms', 0):>9.0f}{r.get('p99_ms', 0):>9.0f}"
+          f"{r.get('rss_max_mb', 0):>9.0f}{r.get('cpu_mean_pct', 0):>8.0f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Load test sesi Streamlit paralel lewat websocket')
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 5, 10, 25],
+                        help='tingkat konkurensi yang diuji berurutan')
+    parser.add_argument('--duration', type=float, default=20, help='detik per tingkat')
+    parser.add_argument('--rate', type=float, default=0.5, help='perpindahan tab per detik per sesi')
+    parser.add_argument('--tabs', nargs='*', default=list(TABS))
+    parser.add_argument('--port', type=int, default=8599)
+    parser.add_argument('--url', help='websocket server yang sudah jalan, mis. ws://127.0.0.1:8501')
+    parser.add_argument('--pid', type=int, help='pid server untuk --url (RSS/CPU)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='loadtest_results.json')
+    args = parser.parse_args(argv)
+
+    proc = None
+    if args.url:
+        url, pid = args.url.rstrip('/'), args.pid
+    else:
+        proc = start_server(args.port)
+        url, pid = f'ws://127.0.0.1:{args.port}', proc.pid
+
+    results = []
+    print(f"{'sessions':>8}{'reruns':>8}{'errors':>7}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'RSS MB':>9}{'CPU %':>8}")
+    try:
+        for n in args.sessions:
+            result = asyncio.run(run_level(url, n, args.duration, args.rate, args.tabs, pid, args.seed))
+            results.append(result)
+            _print_row(result)
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    Path(args.output).write_text(json.dumps({
+        'config': {'duration_s': args.duration, 'rate': args.rate, 'tabs': args.tabs},
+        'levels': results,
+    }, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Laporan memori server per sesi tambahan.
+
+Script menjalankan app di server Streamlit lokal dan membuka sesi satu per
+satu. Setiap sesi mengunjungi semua tab lalu dibiarkan tetap terbuka, dan
+RSS server dicatat setelah setiap sesi. Kemiringan RSS terhadap jumlah
+sesi (MB per sesi tambahan) dihitung tanpa sesi pertama, yang ikut
+menanggung import dan cache sekali-jalan.
+
+    python benchmarks/memory_report.py --sessions 20
+    python benchmarks/memory_report.py --sessions 20 --ref eb8e8f3   # bandingkan dengan commit lain
+
+Dengan ``--ref``, commit tersebut di-checkout ke git worktree sementara dan
+diukur dengan cara yang sama, sehingga angka sebelum/sesudah tercetak
+berdampingan. Hanya Linux (RSS dari ``/proc``).
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from loadtest import ROOT_DIR, TABS, ProcSampler, Session, start_server
+
+
+async def _measure(url, pid, n_sessions, settle):
+    sampler = ProcSampler(pid)
+    sessions = []
+    await asyncio.sleep(settle)
+    rows = [{'sessions': 0, 'rss_mb': sampler.sample()[1] / 2**20}]
+    try:
+        for n in range(1, n_sessions + 1):
+            session = Session(url)
+            await session.connect()
+            for tab in TABS:
+                await session.rerun(tab)
+            sessions.append(session)
+            await asyncio.sleep(settle)
+            rows.append({'sessions': n, 'rss_mb': sampler.sample()[1] / 2**20})
+    finally:
+        await asyncio.gather(*(s.close() for s in sessions), return_exceptions=True)
+    return rows
+
+
+def _slope(rows):
+    points = [(r['sessions'], r['rss_mb']) for r in rows if r['sessions'] >= 1]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    den = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / den
+
+
+def report(app, port, n_sessions, settle):
+    proc = start_server(port, app)
+    try:
+        rows = asyncio.run(_measure(f'ws://127.0.0.1:{port}', proc.pid, n_sessions, settle))
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+    return {'rows': rows, 'mb_per_session': _slope(rows),
+            'first_session_mb': rows[1]['rss_mb'] - rows[0]['rss_mb'] if len(rows) > 1 else None}
+
+
+def report_ref(ref, port, n_sessions, settle):
+    with tempfile.TemporaryDirectory() as tmp:
+        worktree = Path(tmp) / 'app'
+        subprocess.run(['git', 'worktree', 'add', '--detach', str(worktree), ref],
+                       cwd=ROOT_DIR, check=True, capture_output=True)
+        try:
+            return report(worktree / 'app.py', port, n_sessions, settle)
+        finally:
+            subprocess.run(['git', 'worktree', 'remove', '--force', str(worktree)],
+                           cwd=ROOT_DIR, check=False, capture_output=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='RSS server per sesi tambahan')
+    parser.add_argument('--sessions', type=int, default=10)
+    parser.add_argument('--port', type=int, default=8598)
+    parser.add_argument('--settle', type=float, default=1.0, help='jeda (detik) sebelum membaca RSS')
+    parser.add_argument('--ref', help='commit/branch pembanding ("sebelum")')
+    parser.add_argument('--output', default='memory_report.json')
+    args = parser.parse_args(argv)
+
+    results = {'current': report(ROOT_DIR / 'app.py', args.port, args.sessions, args.settle)}
+    if args.ref:
+        results[args.ref] = report_ref(args.ref, args.port, args.sessions, args.settle)
+
+    labels = list(results)
+    print(f"{'sessions':>8}" + ''.join(f'{label[:14]:>16}' for label in labels) + '   (RSS MB)')
+    for i in range(args.sessions + 1):
+        print(f'{i:>8}' + ''.join(f"{results[label]['rows'][i]['rss_mb']:>16.1f}" for label in labels))
+    for label in labels:
+        r = results[label]
+        print(f"{label}: sesi pertama {r['first_session_mb']:+.1f} MB, "
+              f"setiap sesi tambahan {r['mb_per_session']:+.2f} MB")
+    Path(args.output).write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
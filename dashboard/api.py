@@ -0,0 +1,208 @@
+"""API JSON read-only untuk embed chart: figure, insight dan data tiap tab.
+
+Server HTTP ringan yang jalan di samping app Streamlit dan memakai data layer
+yang sama (``data.load``, cache figure, ``content()`` modul tab), jadi satu
+embed tidak perlu membuka sesi Streamlit dan menjalankan seluruh ``app.py``.
+ETag dihitung dari versi data indikator tab dan versi kode dashboard. Body
+dibuat sekali per ETag dan disimpan di LRU (mentah dan gzip); request
+kondisional yang cocok dijawab 304 dari entri itu, jadi resource yang tidak
+ada (mis. indeks figure di luar jangkauan) tetap 404.
+
+Endpoint::
+
+    GET /api/tabs                                  daftar tab dan URL-nya
+    GET /api/tabs/<tab>[?region=<kode>]            figure dan insight tab
+    GET /api/tabs/<tab>/figures/<i>[?region=...]   satu figure (spec Plotly)
+    GET /api/tabs/<tab>/data[?region=...]          tabel indikator tab
+
+Contoh::
+
+    python -m dashboard.api --port 8502
+    curl -H 'Accept-Encoding: gzip' http://127.0.0.1:8502/api/tabs/kemiskinan/figures/1
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import plotly.io as pio
+
+from dashboard import data, figures, tabs, versions
+
+PORT = 8502
+# Naikkan kalau bentuk respons berubah supaya ETag lama tidak cocok lagi
+FORMAT = 1
+MAX_ENTRIES = 256
+MAX_BYTES = 32 * 1024 * 1024
+# Klien boleh memakai respons tanpa revalidasi selama ini (detik)
+MAX_AGE = 60
+
+SLUGS = {slug: tab for tab, slug in tabs.TABS.items()}
+
+
+class Response:
+    def __init__(self, body):
+        self.body = body.encode()
+        self.gzip = gzip.compress(self.body, 6)
+        self.nbytes = len(self.body) + len(self.gzip)
+
+
+# LRU yang sama dengan cache figure, entrinya body respons
+_responses = figures.FigureCache(MAX_ENTRIES, MAX_BYTES)
+
+
+def _etag(*parts):
+    return '"' + hashlib.sha1(json.dumps([FORMAT, *parts]).encode()).hexdigest()[:20] + '"'
+
+
+def _tab_version(tab, region):
+    # Figure dan insight tab juga bergantung pada modul bersama, jadi versi kodenya seluruh dashboard
+    data_versions = [data.data_version(name, region) for name in tabs.TAB_INDICATORS.get(tab, ())]
+    return [tab, region, versions.code_version(), data_versions]
+
+
+def _region(tab, query):
+    region = query.get('region', [data.NATIONAL])[0]
+    names = tabs.TAB_INDICATORS.get(tab, ())
+    # Pilihan wilayah hanya ada di tab dengan satu indikator, sama seperti picker di app
+    if region != data.NATIONAL and (len(names) != 1 or region not in data.regions(names[0])):
+        raise LookupError(f'wilayah {region!r} tidak tersedia di tab {tab}')
+    return region
+
+
+def _index():
+    return json.dumps({'tabs': [{'tab': tab, 'slug': slug, 'indicators': list(tabs.TAB_INDICATORS.get(tab, ())),
+                                 'url': f'/api/tabs/{slug}', 'data': f'/api/tabs/{slug}/data'}
+                                for slug, tab in SLUGS.items()]})
+
+
+def _content(tab, region, index=None):
+    figs, lines = tabs.get_module(tab).content(region)
+    if index is not None:
+        if not 0 <= index < len(figs):
+            raise LookupError(f'tab {tab} punya {len(figs)} figure')
+        return pio.to_json(figs[index], validate=False)
+    specs = ','.join(pio.to_json(fig, validate=False) for fig in figs)
+    return (f'{{"tab":{json.dumps(tab)},"region":{json.dumps(region)},'
+            f'"figures":[{specs}],"insights":{json.dumps(lines)}}}')
+
+
+def _data(tab, region):
+    tables = ','.join(
+        f'{json.dumps(name)}:'
+        f"{data.load(name, region=region).to_json(orient='split', index=False, date_format='iso', double_precision=6)}"
+        for name in tabs.TAB_INDICATORS.get(tab, ()))
+    return f'{{"tab":{json.dumps(tab)},"region":{json.dumps(region)},"indicators":{{{tables}}}}}'
+
+
+def route(url):
+    """(ETag, fungsi pembuat body) untuk ``url``; LookupError kalau tidak ada."""
+    parts = urlsplit(url)
+    path = [p for p in parts.path.split('/') if p]
+    query = parse_qs(parts.query)
+    if path[:1] != ['api']:
+        raise LookupError('endpoint tidak dikenal')
+    path = path[1:]
+    if path in ([], ['tabs']):
+        return _etag('index', list(tabs.TABS)), _index
+    if len(path) < 2 or path[0] != 'tabs' or path[1] not in SLUGS:
+        raise LookupError('endpoint tidak dikenal')
+
+    tab = SLUGS[path[1]]
+    region = _region(tab, query)
+    version = _tab_version(tab, region)
+    rest = path[2:]
+    if rest == []:
+        return _etag('tab', *version), lambda: _content(tab, region)
+    if rest == ['data']:
+        return _etag('data', *version), lambda: _data(tab, region)
+    if len(rest) == 2 and rest[0] == 'figures' and rest[1].isdigit():
+        return _etag('figure', int(rest[1]), *version), lambda: _content(tab, region, int(rest[1]))
+    raise LookupError('endpoint tidak dikenal')
+
+
+def matches(if_none_match, etag):
+    """True kalau header ``If-None-Match`` cocok dengan ``etag`` (perbandingan lemah, ``*`` cocok semua)."""
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in tags or etag in [tag[2:] if tag.startswith('W/') else tag for tag in tags]
+
+
+def response(etag, build):
+    """Body untuk ``etag``, dibangun sekali lalu diambil dari LRU."""
+    entry = _responses.get(etag)
+    if entry is None:
+        entry = Response(build())
+        _responses.put(etag, entry)
+    return entry
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _send(self, status, body=b'', headers=()):
+        self.send_response(status)
+        for key, value in headers:
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body and self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _error(self, status, message):
+        self._send(status, json.dumps({'error': message}).encode(), [('Content-Type', 'application/json')])
+
+    def do_GET(self):
+        try:
+            etag, build = route(self.path)
+        except LookupError as exc:
+            self._error(404, str(exc))
+            return
+
+        try:
+            # Dari LRU kalau sudah pernah dibangun; sekaligus memastikan resource-nya ada
+            entry = response(etag, build)
+        except LookupError as exc:
+            self._error(404, str(exc))
+            return
+
+        headers = [('ETag', etag), ('Cache-Control', f'public, max-age={MAX_AGE}'),
+                   ('Vary', 'Accept-Encoding'), ('Access-Control-Allow-Origin', '*')]
+        if matches(self.headers.get('If-None-Match', ''), etag):
+            self._send(304, headers=headers)
+            return
+
+        headers.append(('Content-Type', 'application/json'))
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            self._send(200, entry.gzip, [*headers, ('Content-Encoding', 'gzip')])
+        else:
+            self._send(200, entry.body, headers)
+
+    do_HEAD = do_GET
+
+
+def server(port=PORT, host='127.0.0.1'):
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m dashboard.api', description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--host', default='127.0.0.1')
+    args = parser.parse_args(argv)
+
+    httpd = server(args.port, args.host)
+    print(f'http://{args.host}:{args.port}/api/tabs')
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Tambah rilis BPS baru ke indikator tanpa menghitung ulang seluruh histori.
+
+Periode baru ditambahkan di akhir file sumber. Kolom turunannya (y-o-y,
+q-to-q, c-to-c, ...) dihitung dari periode baru ditambah beberapa periode
+terakhir yang dibutuhkan (``CONTEXT``). Kalau store sedang mutakhir, baris
+turunan itu ditambahkan ke store dan hanya partisi tahun yang terkena yang
+ditulis ulang. App yang sedang jalan melihat versi sumber baru di rerun
+berikutnya. Cache yang memakai versi indikator ini (data, figure, insight)
+dibangun ulang, dan cache indikator lain tidak tersentuh.
+
+Contoh::
+
+    python -m dashboard.append pdb Tahun=2024 Triwulan=III PDB_HB=5638764.1 PDB_HK=5638764.1
+    python -m dashboard.append kemiskinan --csv rilis_2025_maret.csv
+"""
+import argparse
+import sys
+
+import pandas as pd
+
+from dashboard import data, periods, store
+from dashboard.tabs import tabs_using
+
+# Periode histori yang dibutuhkan kolom turunan: y-o-y butuh 4 triwulan
+# sebelumnya, c-to-c butuh kumulatif tahun lalu sejak triwulan I
+CONTEXT = {'pdb': 8}
+
+
+def source_path(name):
+    paths, _ = data.INDICATORS[name]
+    if name not in data.DERIVE or len(paths) != 1:
+        raise ValueError(f'{name!r} tidak mendukung append')
+    return paths[0]
+
+
+def _periods(df, keys):
+    return list(zip(*(periods.period_key(df[k]) for k in keys)))
+
+
+def _check_order(keys, existing, new):
+    keys = _periods(existing.tail(1), keys) + _periods(new, keys)
+    if any(a >= b for a, b in zip(keys, keys[1:])):
+        raise ValueError('periode baru harus terurut dan setelah periode terakhir di file sumber')
+
+
+def _append_csv(path, rows):
+    with open(path, 'rb+') as f:
+        f.seek(0, 2)
+        if f.tell():
+            f.seek(-1, 2)
+            if f.read(1) != b'\n':
+                f.write(b'\n')
+    rows.to_csv(path, mode='a', header=False, index=False)
+
+
+def append(name, rows, store_dir=None):
+    """Tambah ``rows`` (kolom sama dengan file sumber) ke indikator ``name``.
+
+    Mengembalikan baris baru beserta kolom turunannya.
+    """
+    path = source_path(name)
+    source = pd.read_csv(path)
+    rows = pd.DataFrame(rows)
+    missing = [c for c in source.columns if c not in rows.columns]
+    if missing:
+        raise ValueError(f"kolom tidak ada: {', '.join(missing)}")
+    rows = rows[list(source.columns)].astype(source.dtypes.to_dict()).reset_index(drop=True)
+    _check_order([k for k in periods.PERIOD_KEYS if k in source.columns], source, rows)
+
+    context = source.tail(CONTEXT.get(name, 0))
+    derived = data.DERIVE[name](pd.concat([context, rows], ignore_index=True))
+    derived = derived.iloc[len(context):].reset_index(drop=True)
+
+    stored = store.has(name, data.data_version(name), store_dir)
+    _append_csv(path, rows)
+    if stored:
+        store.append(name, derived, data.data_version(name), store_dir)
+    return derived
+
+
+def _parse_values(values):
+    row = {}
+    for item in values:
+        column, sep, value = item.partition('=')
+        if not sep:
+            raise ValueError(f'format KOLOM=NILAI: {item!r}')
+        row[column] = value
+    return [row]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m dashboard.append', description=__doc__.splitlines()[0])
+    parser.add_argument('name', choices=sorted(data.DERIVE), help='indikator')
+    parser.add_argument('values', nargs='*', help='KOLOM=NILAI untuk satu periode baru')
+    parser.add_argument('--csv', help='file berisi periode baru (header sama dengan file sumber)')
+    parser.add_argument('--store', default=None, help=f'direktori store (default: {store.STORE_DIR})')
+    args = parser.parse_args(argv)
+
+    if bool(args.csv) == bool(args.values):
+        parser.error('isi KOLOM=NILAI atau --csv (salah satu)')
+    try:
+        rows = pd.read_csv(args.csv) if args.csv else _parse_values(args.values)
+        derived = append(args.name, rows, args.store)
+    except ValueError as exc:
+        parser.error(str(exc))
+    stored = store.has(args.name, data.data_version(args.name), args.store)
+    added = ', '.join(derived['Period'].astype(str)) if 'Period' in derived else f'{len(derived)} baris'
+    print(f"{args.name}: {added} ditambahkan, store {'diperbarui' if stored else 'tidak dipakai'}, "
+          f"tab terkena: {', '.join(tabs_using(args.name)) or '-'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
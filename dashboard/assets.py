@@ -0,0 +1,67 @@
+"""Aset tampilan (CSS dan logo header) dari ``static/``, di-encode sekali per proses.
+
+Stylesheet dan logo dibaca dari disk dan logo di-encode base64 hanya saat isi
+filenya berubah (key cache: hash file). Hasilnya satu blok HTML header yang
+sama byte demi byte di setiap rerun. Streamlit mengirim elemen besar yang
+identik dengan rerun sebelumnya sebagai referensi hash ke salinan di browser,
+jadi CSS dan logo tidak dikirim ulang selama isinya tidak berubah.
+
+Kalau ``DASHBOARD_ASSET_URL`` diisi (mis. CDN atau reverse proxy yang melayani
+``static/`` dengan header cache panjang), logo dirujuk lewat URL ber-fingerprint
+``<url>/<file>?v=<hash>`` alih-alih di-inline.
+"""
+import base64
+import html
+import mimetypes
+import os
+
+import streamlit as st
+
+from dashboard import versions
+
+STATIC_DIR = versions.ROOT_DIR / 'static'
+ASSET_URL = os.environ.get('DASHBOARD_ASSET_URL', '').rstrip('/')
+STYLESHEET = 'style.css'
+# Posisi -> (file, alt, lebar px); logo yang belum ada di static/ dilewati
+LOGOS = {
+    'left': ('aig_logo.png', 'AIG Logo', 70),
+    'right': ('bps_logo.png', 'BPS Logo', 85),
+}
+
+
+def fingerprint(name):
+    """Hash pendek isi ``static/<name>``, atau None kalau file tidak ada."""
+    path = STATIC_DIR / name
+    return versions.file_digest(path)[:12] if path.exists() else None
+
+
+def _source(name, digest):
+    if ASSET_URL:
+        return f'{ASSET_URL}/{name}?v={digest}'
+    mime = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+    encoded = base64.b64encode((STATIC_DIR / name).read_bytes()).decode()
+    return f'data:{mime};base64,{encoded}'
+
+
+def _logo(side, digest):
+    name, alt, width = LOGOS[side]
+    if digest is None:
+        return '<div class="logo-container"></div>'
+    return (f'<div class="logo-container"><img src="{_source(name, digest)}" alt="{html.escape(alt)}" '
+            f'style="width: {width}px; height: 70px; object-fit: contain;"></div>')
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _header(css_digest, logo_digests):
+    css = (STATIC_DIR / STYLESHEET).read_text()
+    left, right = (_logo(side, digest) for side, digest in zip(LOGOS, logo_digests))
+    return (f'<style>\n{css}</style>\n'
+            f'<div class="header-container">{left}'
+            '<div class="header-title"><div class="logo-title">ACTIONABLE INSIGHTS</div>'
+            f'<div class="subtitle">Generate wisdom from fingertip</div></div>{right}</div>')
+
+
+def header_html():
+    """Stylesheet plus header (judul dan logo) sebagai satu blok HTML, di-cache per isi file."""
+    logo_digests = tuple(fingerprint(name) for name, _, _ in LOGOS.values())
+    return _header(fingerprint(STYLESHEET), logo_digests)
@@ -0,0 +1,148 @@
+"""Server pengganti WebAPI BPS yang memutar ulang respons rekaman, untuk uji offline.
+
+Respons disimpan satu file per variabel (``<var>.json``, format respons
+``list/model/data`` BPS). Rekaman bisa berasal dari respons BPS asli (salin isi
+``bps_cache/``) atau dibangkitkan dari file sumber di ``data/`` dengan
+``--record``. Server menjawab dengan ``ETag`` dan ``Last-Modified`` dan
+mengembalikan 304 untuk request kondisional yang masih cocok, seperti server
+BPS. Koneksi keep-alive (HTTP/1.1) didukung, jadi pool koneksi
+``dashboard.fetch`` ikut teruji.
+
+Contoh::
+
+    python -m dashboard.bps_replay rekaman --record     # rekam dari data/
+    python -m dashboard.bps_replay rekaman --port 8765
+    DASHBOARD_BPS_URL=http://127.0.0.1:8765 python -m dashboard.fetch
+"""
+import argparse
+import hashlib
+import json
+import re
+import sys
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pandas as pd
+
+from dashboard import data, fetch, periods
+
+PORT = 8765
+_VAR = re.compile(r'/var/(\d+)/')
+
+
+def responses(name, df):
+    """Respons BPS per variabel untuk tabel sumber ``df`` (kebalikan ``fetch.table``)."""
+    kind, columns = fetch.SOURCES[name]
+    keys = periods.SOURCE_KEYS[kind]
+    turtahun = [{'val': i, 'label': label} for i, label in enumerate(fetch.TURTAHUN[kind], start=1)]
+    codes = {value: item['val'] for item, value in zip(turtahun, fetch.TURTAHUN[kind].values())}
+    years = sorted(df['Tahun'].unique())
+    tahun = [{'val': int(year) - 1900, 'label': str(year)} for year in years]
+
+    payloads = {}
+    for column, (var, turvar) in columns.items():
+        payload = payloads.setdefault(var, {
+            'status': 'OK', 'data-availability': 'available',
+            'var': [{'val': var, 'label': column}], 'turvar': [], 'labelvervar': 'Wilayah',
+            'vervar': [{'val': fetch.VERVAR, 'label': 'INDONESIA'}],
+            'tahun': tahun, 'turtahun': turtahun, 'datacontent': {},
+        })
+        payload['turvar'].append({'val': turvar, 'label': column})
+        for row in df[[*keys, column]].dropna().itertuples(index=False):
+            code = codes[row[1] if len(keys) > 1 else None]
+            payload['datacontent'][f'{fetch.VERVAR}{var}{turvar}{int(row[0]) - 1900}{code}'] = float(row[-1])
+    return payloads
+
+
+def record(out_dir, names=None):
+    """Tulis rekaman respons dari file sumber indikator ``names`` ke ``out_dir``."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for name in names or fetch.SOURCES:
+        (path,), _ = data.INDICATORS[name]
+        for var, payload in responses(name, pd.read_csv(path)).items():
+            (out_dir / f'{var}.json').write_text(json.dumps(payload))
+            written.append(var)
+    return written
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    directory = Path('.')
+
+    def _send(self, status, body=b'', headers=()):
+        self.send_response(status)
+        for key, value in headers:
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        match = _VAR.search(self.path)
+        path = self.directory / f'{match.group(1)}.json' if match else None
+        if path is None or not path.is_file():
+            self._send(404, b'{"status":"Error","message":"variabel tidak ditemukan"}',
+                       [('Content-Type', 'application/json')])
+            return
+
+        body = path.read_bytes()
+        mtime = int(path.stat().st_mtime)
+        validators = [('ETag', f'"{hashlib.sha1(body).hexdigest()[:16]}"'),
+                      ('Last-Modified', formatdate(mtime, usegmt=True))]
+        if self._not_modified(validators[0][1], mtime):
+            self._send(304, headers=validators)
+            return
+        self._send(200, body, [('Content-Type', 'application/json'), *validators])
+
+    def _not_modified(self, etag, mtime):
+        # If-None-Match menang atas If-Modified-Since (RFC 9110)
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            return etag in [tag.strip() for tag in if_none_match.split(',')]
+        since = self.headers.get('If-Modified-Since')
+        try:
+            return since is not None and mtime <= parsedate_to_datetime(since).timestamp()
+        except (TypeError, ValueError):
+            return False
+
+
+def server(directory, port=PORT, host='127.0.0.1'):
+    """``ThreadingHTTPServer`` yang melayani rekaman di ``directory`` (panggil ``serve_forever()``)."""
+    handler = type('ReplayHandler', (Handler,), {'directory': Path(directory)})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m dashboard.bps_replay', description=__doc__.splitlines()[0])
+    parser.add_argument('directory', help='direktori rekaman respons (<var>.json)')
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--record', nargs='*', metavar='INDIKATOR',
+                        help='rekam respons dari file sumber di data/ lalu keluar (default: semua di SOURCES)')
+    args = parser.parse_args(argv)
+
+    if args.record is not None:
+        unknown = [n for n in args.record if n not in fetch.SOURCES]
+        if unknown:
+            parser.error(f"indikator tidak punya sumber BPS: {', '.join(unknown)}")
+        written = record(args.directory, args.record)
+        print(f'{len(written)} variabel -> {args.directory}')
+        return 0
+
+    httpd = server(args.directory, args.port, args.host)
+    print(f'http://{args.host}:{args.port} <- {args.directory}')
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""Emisi chart Plotly ke Streamlit."""
+import streamlit as st
+
+from dashboard import downsample, instrumentation, payload
+
+
+def zoom_selection(zoom_key):
+    """Titik x yang dipilih (box-select) di chart ``zoom_key`` pada interaksi terakhir."""
+    if zoom_key is None:
+        return None
+    return downsample.selected_x(st.session_state.get(zoom_key))
+
+
+def period_range(df, key, label='Periode'):
+    """Slider rentang periode di atas kolom ``Period``/``Date`` terurut ``df``.
+
+    Mengembalikan ``(Date awal, Date akhir)`` untuk ``downsample.window``, atau
+    None kalau seluruh seri dipilih (key cache figure sama dengan tanpa filter).
+    """
+    labels = df['Period'].tolist()
+    if len(labels) < 2:
+        return None
+    # Opsi berupa posisi baris, jadi tanggal diambil langsung tanpa mencari label
+    lo, hi = st.select_slider(label, options=range(len(labels)), value=(0, len(labels) - 1),
+                              format_func=labels.__getitem__, key=key)
+    if (lo, hi) == (0, len(labels) - 1):
+        return None
+    dates = df['Date']
+    return dates.iloc[lo], dates.iloc[hi]
+
+
+def plotly_chart(fig, zoom_key=None, **kwargs):
+    """``st.plotly_chart``; dengan ``zoom_key`` box-select memicu rerun untuk zoom resolusi penuh.
+
+    Figure dari ``figures`` sudah diringkas saat build; figure lain diringkas di
+    sini. Ukuran payload setiap chart dicatat ke ``instrumentation``.
+    """
+    kwargs.setdefault('use_container_width', True)
+    if zoom_key is not None:
+        kwargs.update(key=zoom_key, on_select='rerun', selection_mode='box')
+    with instrumentation.span('chart_emit'):
+        nbytes = getattr(fig, '_payload_bytes', None)
+        if nbytes is None:
+            fig = payload.compact(fig)
+            nbytes = payload.nbytes(fig)
+        instrumentation.record_payload(payload.chart_name(fig), nbytes)
+        return st.plotly_chart(fig, **kwargs)
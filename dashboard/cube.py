@@ -0,0 +1,105 @@
+"""Cube regional: nasional, provinsi dan kabupaten/kota dalam satu tabel panjang.
+
+Input adalah export BPS per wilayah dengan kolom ``Kode_Wilayah`` (kode BPS:
+2 digit provinsi, 4 digit kabupaten/kota, ``00`` nasional), opsional
+``Nama_Wilayah``, kolom periode (``Tahun`` plus ``Triwulan``/``Semester``/``Bulan``)
+dan ukuran indikator. Level yang tidak ada di input dijumlahkan dari level di
+bawahnya untuk ukuran yang aditif. Rasio (persentase, Gini, IPM) hanya dipakai
+seperti dirilis karena tidak bisa dijumlahkan. Kolom turunan dihitung per
+wilayah, lalu cube ditulis ke store dengan partisi per ``Provinsi``. Dengan
+begitu satu provinsi beserta kabupaten/kotanya bisa dibaca tanpa menyentuh
+partisi lain.
+
+Contoh::
+
+    python -m dashboard.cube pdb pdrb_kabupaten.csv
+    python -m dashboard.cube kemiskinan kemiskinan_kabupaten.csv
+"""
+import argparse
+import sys
+
+import pandas as pd
+
+from dashboard import data, periods, store
+
+WILAYAH_FILE = data.DATA_DIR / 'wilayah.csv'
+
+# Ukuran per indikator: True = aditif (boleh dijumlahkan dari level di bawahnya)
+MEASURES = {
+    'pdb': {'PDB_HB': True, 'PDB_HK': True},
+    'kemiskinan': {'Jumlah_Miskin': True, 'Persentase_Miskin': False, 'Gini_Ratio': False},
+    'ipm': {'IPM_Laki_laki': False, 'IPM_Perempuan': False},
+}
+
+
+def _level_mask(codes, level):
+    if level == 'provinsi':
+        return (codes.str.len() == 2) & (codes != data.NATIONAL)
+    return codes.str.len() == 4
+
+
+def _rollup(df, keys, additive, level, parent):
+    """Isi baris induk yang kosong dengan jumlah baris ``level`` (``parent``: kode anak -> kode induk)."""
+    children = df[_level_mask(df['Kode_Wilayah'], level)]
+    if children.empty or not additive:
+        return df
+    summed = (children.assign(Kode_Wilayah=parent(children['Kode_Wilayah']))
+              .groupby(['Kode_Wilayah', *keys], sort=False)[additive].sum(min_count=1))
+    # Angka rilis menang; hasil penjumlahan hanya mengisi yang kosong
+    return df.set_index(['Kode_Wilayah', *keys]).combine_first(summed).reset_index()
+
+
+def region_names(df, codes):
+    """``{kode: nama}`` terurut kode; nama dari input, lalu ``wilayah.csv``, lalu kode itu sendiri."""
+    names = pd.read_csv(WILAYAH_FILE, dtype=str).set_index('Kode_Wilayah')['Nama_Wilayah']
+    if 'Nama_Wilayah' in df.columns:
+        given = df.dropna(subset=['Nama_Wilayah']).drop_duplicates('Kode_Wilayah')
+        names = given.set_index('Kode_Wilayah')['Nama_Wilayah'].combine_first(names)
+    return {code: names.get(code, code) for code in sorted(codes.unique())}
+
+
+def build(name, df, measures=None):
+    """Cube indikator ``name`` dari tabel regional ``df``, siap ditulis ke store.
+
+    ``measures`` (kolom -> aditif) default dari ``MEASURES``.
+    """
+    measures = MEASURES[name] if measures is None else measures
+    keys = [k for k in periods.PERIOD_KEYS if k in df.columns]
+    given = df.copy()
+    given['Kode_Wilayah'] = given['Kode_Wilayah'].astype(str).str.zfill(2)
+    columns = ['Kode_Wilayah', *keys, *[m for m in measures if m in given.columns]]
+    additive = [m for m, is_additive in measures.items() if is_additive and m in given.columns]
+
+    # Kabupaten/kota -> provinsi -> nasional
+    df = _rollup(given[columns], keys, additive, 'kabupaten', lambda codes: codes.str[:2])
+    df = _rollup(df, keys, additive, 'provinsi', lambda codes: data.NATIONAL)[columns]
+    names = region_names(given, df['Kode_Wilayah'])
+
+    df = df.sort_values(['Kode_Wilayah', *keys], key=periods.period_key, kind='stable', ignore_index=True)
+    df = data.DERIVE[name](df, by='Kode_Wilayah')
+    df['Provinsi'] = df['Kode_Wilayah'].str[:2]
+    return df, names
+
+
+def write(name, path, store_dir=None):
+    df, names = build(name, pd.read_csv(path, dtype={'Kode_Wilayah': str}))
+    return store.write(data.cube_name(name), df, data.file_digest(path), store_dir,
+                       partition=('Provinsi',), extra_meta={'regions': names})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m dashboard.cube', description=__doc__.splitlines()[0])
+    parser.add_argument('name', choices=sorted(MEASURES), help='indikator')
+    parser.add_argument('csv', help='export BPS per wilayah')
+    parser.add_argument('--store', default=None, help=f'direktori store (default: {store.STORE_DIR})')
+    args = parser.parse_args(argv)
+
+    meta = write(args.name, args.csv, args.store)
+    provinces = sum(1 for code in meta['regions'] if len(code) == 2 and code != data.NATIONAL)
+    regencies = sum(1 for code in meta['regions'] if len(code) == 4)
+    print(f"{data.cube_name(args.name)}: {meta['rows']} baris, {provinces} provinsi, {regencies} kabupaten/kota")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
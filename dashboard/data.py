@@ -0,0 +1,217 @@
+"""Loader indikator: baca file sumber sekali, cache per proses.
+
+Setiap indikator terdaftar di ``INDICATORS`` bersama file sumber dan parser-nya.
+DataFrame hasil parse disimpan dengan ``st.cache_resource`` sehingga dipakai
+bersama (read-only) oleh semua sesi, dan otomatis diganti begitu hash file
+sumber berubah. Frame di cache memakai dtype ringkas (``dashboard.schema``).
+
+``load()`` mengembalikan shallow copy dengan copy-on-write: pemanggil boleh
+menambah kolom atau mengubah nilai tanpa menyentuh frame bersama, dan data
+baru disalin hanya untuk kolom yang benar-benar diubah.
+
+Data per wilayah (provinsi, kabupaten/kota) dibaca dari cube regional di store
+(lihat ``dashboard.cube``): hanya partisi provinsi yang dipilih yang dimuat,
+lalu wilayah diambil lewat index ``Kode_Wilayah`` yang terurut.
+"""
+import hashlib
+import os
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from dashboard import instrumentation, metrics, periods, schema, store
+from dashboard.versions import ROOT_DIR, file_digest
+
+# pandas 3 selalu copy-on-write; pandas 2 perlu diaktifkan supaya shallow copy aman
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+DATA_DIR = ROOT_DIR / 'data'
+# File sumber data sintetis; arahkan ke direktori lain untuk uji skala
+SYNTHETIC_DIR = Path(os.environ.get('DASHBOARD_SYNTHETIC_DIR', DATA_DIR / 'synthetic'))
+
+# Kode wilayah BPS: '00' nasional, 2 digit provinsi, 4 digit kabupaten/kota
+NATIONAL = '00'
+
+def derive_pdb(df, by=None):
+    # Pertumbuhan dihitung dari level, bukan diketik manual
+    return periods.add_columns(metrics.add_growth(df, by=by))
+
+
+def parse_pdb(path):
+    return derive_pdb(pd.read_csv(path))
+
+
+def parse_pdb_growth(path):
+    # Pertumbuhan y-o-y rilis BPS, sebagai pembanding hasil hitungan dari level
+    return periods.add_columns(pd.read_csv(path).rename(columns={'y-o-y': 'y_o_y'}))
+
+
+def parse_pdb_yoy_export(path):
+    # Export Tableau: "Quarter of Periode" berformat "2011 Q1"
+    df = pd.read_csv(path).rename(columns={'Quarter of Periode': 'Period', 'Y-O-Y': 'y_o_y'})
+    parts = df['Period'].str.extract(r'(?P<Tahun>\d{4}) Q(?P<Q>[1-4])').astype(int)
+    df['Tahun'] = parts['Tahun']
+    df['Triwulan'] = parts['Q'].map(periods.QUARTER_ROMAN)
+    df['Date'] = periods.period_index(df).start_time
+    return df[['Tahun', 'Triwulan', 'Period', 'Date', 'y_o_y']]
+
+
+def derive_kemiskinan(df, by=None):
+    return periods.add_columns(df.copy())
+
+
+def parse_kemiskinan(path):
+    return derive_kemiskinan(pd.read_csv(path))
+
+
+def parse_table(path):
+    # Export BPS generik: tambahkan Period/Date kalau ada kolom periode yang dikenal
+    df = pd.read_csv(path)
+    if periods.source_frequency(df.columns) not in (None, 'tahunan'):
+        periods.add_columns(df)
+    return df
+
+
+def derive_periods(df, by=None):
+    # Tabel tanpa kolom turunan selain Period/Date (mis. data sintetis bulanan)
+    return periods.add_columns(df.copy())
+
+
+def derive_ipm(df, by=None):
+    df = df.copy()
+    df['Gender_Gap'] = df['IPM_Laki_laki'] - df['IPM_Perempuan']
+    df['IPM_Total'] = (df['IPM_Laki_laki'] + df['IPM_Perempuan']) / 2
+    return df
+
+
+def parse_ipm(path):
+    return derive_ipm(pd.read_csv(path))
+
+
+# nama indikator -> (file sumber, parser)
+INDICATORS = {
+    'pdb': ((DATA_DIR / 'pdb.csv',), parse_pdb),
+    'pdb_growth': ((ROOT_DIR / 'pdb_growth.csv',), parse_pdb_growth),
+    'pdb_yoy_export': ((ROOT_DIR / 'Sheet 1_Full Data_data.csv',), parse_pdb_yoy_export),
+    'kemiskinan': ((DATA_DIR / 'kemiskinan.csv',), parse_kemiskinan),
+    'ipm': ((DATA_DIR / 'ipm.csv',), parse_ipm),
+    # Data sintetis untuk tab placeholder, dibangkitkan oleh dashboard.synthetic
+    'inflasi': ((SYNTHETIC_DIR / 'inflasi.csv',), parse_table),
+    'ekspor_impor': ((SYNTHETIC_DIR / 'ekspor_impor.csv',), parse_table),
+    'apbn': ((SYNTHETIC_DIR / 'apbn.csv',), parse_table),
+    'ketenagakerjaan': ((SYNTHETIC_DIR / 'ketenagakerjaan.csv',), parse_table),
+}
+
+# Kolom turunan per indikator, dipakai juga untuk tabel regional (``by`` = seri per wilayah)
+DERIVE = {
+    'pdb': derive_pdb,
+    'kemiskinan': derive_kemiskinan,
+    'ipm': derive_ipm,
+    'inflasi': derive_periods,
+    'ekspor_impor': derive_periods,
+    'apbn': derive_periods,
+    'ketenagakerjaan': derive_periods,
+}
+
+
+def cube_name(name):
+    return f'{name}_cube'
+
+
+def cube_version(name):
+    """Versi sumber cube regional ``name``, None kalau belum dibangun."""
+    return store.stored_version(cube_name(name))
+
+
+def data_version(name, region=NATIONAL):
+    """Hash gabungan semua file sumber indikator ``name``.
+
+    Untuk wilayah selain nasional: versi cube regional, None kalau belum dibangun.
+    """
+    if region != NATIONAL:
+        return cube_version(name)
+    paths, _ = INDICATORS[name]
+    if len(paths) == 1:
+        return file_digest(paths[0])
+    return hashlib.sha1(''.join(file_digest(p) for p in paths).encode()).hexdigest()
+
+
+def parse(name):
+    paths, parser = INDICATORS[name]
+    return parser(*paths)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _parse(name, version):
+    # Hanya frame ringkas yang disimpan; hasil parse mentah langsung dibuang
+    return schema.compact(parse(name))
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _load(name, version, columns, years):
+    # Store Parquet dipakai kalau dibangun dari versi sumber yang sama
+    if store.has(name, version):
+        return schema.compact(store.read(name, columns=columns, years=years))
+    df = _parse(name, version)
+    if years is not None:
+        df = df[df['Tahun'].isin(years)].reset_index(drop=True)
+    if columns is not None:
+        df = df[list(columns)]
+    return df
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _province(name, version, province):
+    # Hanya partisi satu provinsi yang dibaca; index terurut untuk lookup wilayah
+    df = schema.compact(store.read(cube_name(name), where={'Provinsi': [province]}))
+    return df.set_index('Kode_Wilayah', drop=False).sort_index(kind='stable')
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _regions(name, version):
+    return store.read_meta(cube_name(name))['regions']
+
+
+def regions(name):
+    """``{kode: nama}`` semua wilayah di cube ``name`` (terurut kode), kosong kalau belum ada cube."""
+    version = cube_version(name)
+    return {} if version is None else _regions(name, version)
+
+
+def _load_region(name, region, columns, years):
+    version = data_version(name, region)
+    if version is None:
+        raise KeyError(f'cube {cube_name(name)!r} belum ada, jalankan python -m dashboard.cube')
+    # Slice label pada index terurut = binary search, tanpa groupby/mask seluruh tabel
+    df = _province(name, version, region[:2]).loc[region:region].reset_index(drop=True)
+    if years is not None:
+        df = df[df['Tahun'].isin(years)].reset_index(drop=True)
+    if columns is not None:
+        df = df[list(columns)]
+    return df
+
+
+def load(name, columns=None, years=None, region=NATIONAL):
+    """DataFrame indikator ``name``, dipakai bersama oleh semua sesi. Jangan diubah.
+
+    ``columns`` dan ``years`` membatasi kolom dan tahun yang dibaca, ``region``
+    memilih kode wilayah dari cube regional.
+    """
+    columns = tuple(columns) if columns is not None else None
+    years = tuple(sorted(years)) if years is not None else None
+    with instrumentation.span('data_load'):
+        if region != NATIONAL:
+            return _load_region(name, region, columns, years)
+        return _load(name, data_version(name), columns, years).copy(deep=False)
+
+
+def valid_rows(df, col):
+    """Slice (view) dari baris valid pertama sampai terakhir kolom ``col``."""
+    valid = df[col].notna().to_numpy()
+    if not valid.any():
+        return df.iloc[:0]
+    start = valid.argmax()
+    stop = len(valid) - valid[::-1].argmax()
+    return df.iloc[start:stop]
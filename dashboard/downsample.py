@@ -0,0 +1,107 @@
+"""Downsampling seri panjang sebelum dijadikan trace Plotly.
+
+Budget titik diturunkan dari lebar chart (``point_budget``). Seri yang lebih
+pendek dari budget dikirim apa adanya. Streamlit tidak meneruskan event zoom
+Plotly ke Python, jadi zoom memakai box-select: titik yang dipilih dibaca
+lewat ``selected_x``, lalu data di-slice dengan ``window`` sebelum
+di-downsample. Jendela yang cukup sempit pun tampil dengan resolusi penuh.
+"""
+import numpy as np
+import pandas as pd
+
+# Perkiraan lebar chart utama: kolom 2.5/3.5 di layar ~1500px
+DEFAULT_WIDTH_PX = 1100
+POINTS_PER_PX = 2
+
+
+def point_budget(width_px=DEFAULT_WIDTH_PX, points_per_px=POINTS_PER_PX):
+    return int(width_px * points_per_px)
+
+
+def _numeric(values):
+    values = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.to_numpy('datetime64[ns]').astype('int64').astype(float)
+    return values.to_numpy(float)
+
+
+def lttb_indices(x, y, n):
+    """Posisi baris hasil Largest-Triangle-Three-Buckets, ``n`` titik termasuk ujung."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    size = len(y)
+    if n >= size or n < 3:
+        return np.arange(size)
+    # n-2 bucket di antara titik pertama dan terakhir
+    edges = np.linspace(1, size - 1, n - 1).astype(np.int64)
+    out = np.empty(n, dtype=np.int64)
+    out[0], out[-1] = 0, size - 1
+    a = 0
+    for i in range(n - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else size
+        avg_x = x[hi:next_hi].mean()
+        avg_y = np.nanmean(y[hi:next_hi]) if not np.isnan(y[hi:next_hi]).all() else y[a]
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.where(np.isnan(area), -1.0, area).argmax())
+        out[i + 1] = a
+    return out
+
+
+def minmax_indices(y, n):
+    """Posisi min dan max tiap bucket (n/2 bucket), vektorisasi penuh."""
+    y = np.asarray(y, dtype=float)
+    size = len(y)
+    buckets = max(n // 2, 1)
+    if n >= size:
+        return np.arange(size)
+    bucket = np.arange(size) * buckets // size
+    # Urut per (bucket, y): elemen pertama tiap bucket = min, terakhir = max
+    order = np.lexsort((y, bucket))
+    starts = np.flatnonzero(np.r_[True, bucket[order][1:] != bucket[order][:-1]])
+    ends = np.r_[starts[1:], size] - 1
+    return np.unique(np.r_[order[starts], order[ends]])
+
+
+def needed(n_rows, budget):
+    return n_rows > budget
+
+
+def downsample(df, y, budget, x=None, method='lttb'):
+    """Baris ``df`` yang dipertahankan untuk budget ``budget``; ``x=None`` memakai posisi baris."""
+    if not needed(len(df), budget):
+        return df
+    if method == 'lttb':
+        xs = np.arange(len(df), dtype=float) if x is None else _numeric(df[x])
+        idx = lttb_indices(xs, df[y], budget)
+    elif method == 'minmax':
+        idx = minmax_indices(df[y], budget)
+    else:
+        raise ValueError(f'metode downsampling tidak dikenal: {method!r}')
+    return df.iloc[idx]
+
+
+def selected_x(state):
+    """Nilai x titik yang terpilih lewat box-select ``st.plotly_chart(on_select=...)``, atau None."""
+    try:
+        points = state['selection']['points']
+    except (KeyError, TypeError):
+        return None
+    xs = sorted({p['x'] for p in points if 'x' in p})
+    return tuple(xs) or None
+
+
+def window(df, xs, x):
+    """Slice baris dari nilai ``xs`` terkecil sampai terbesar di kolom terurut ``x``."""
+    if not xs:
+        return df
+    values = df[x]
+    if pd.api.types.is_datetime64_any_dtype(values):
+        # Kolom waktu terurut, jadi cukup binary search
+        lo, hi = pd.Timestamp(xs[0]), pd.Timestamp(xs[-1])
+        return df.iloc[values.searchsorted(lo, side='left'):values.searchsorted(hi, side='right')]
+    # Sumbu kategori (mis. label Period): rentang dari posisi label pertama sampai terakhir
+    pos = np.flatnonzero(values.isin(xs).to_numpy())
+    if len(pos) == 0:
+        return df
+    return df.iloc[pos[0]:pos[-1] + 1]
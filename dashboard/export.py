@@ -0,0 +1,168 @@
+"""Unduh data di balik chart (CSV, XLSX, Parquet), sesuai filter yang aktif.
+
+File dibuat hanya saat tombol diklik (``st.download_button`` dengan callable)
+dan ditulis per potongan ``CHUNK_ROWS`` baris ke cache di disk
+(``exports/``, env ``DASHBOARD_EXPORT_DIR``), jadi tabel regional besar tidak
+pernah dikonversi utuh di memori. Nama file cache adalah hash dari (dataset,
+versi data, filter, format). Klik berikutnya dengan filter yang sama, dari
+sesi mana pun, langsung membuka file yang sudah ada. Versi data baru
+menghasilkan key baru, dan file lama dibuang begitu cache melewati
+``MAX_FILES``; file yang baru dipakai (``MIN_AGE`` detik terakhir) tidak
+dibuang, supaya unduhan sesi lain yang sedang berjalan tidak kehilangan filenya.
+"""
+import hashlib
+import importlib.util
+import os
+import time
+from functools import partial
+from pathlib import Path
+
+import streamlit as st
+
+from dashboard import data, downsample, instrumentation
+
+EXPORT_DIR = Path(os.environ.get('DASHBOARD_EXPORT_DIR', data.ROOT_DIR / 'exports'))
+CHUNK_ROWS = 50_000
+MAX_FILES = 64
+# File yang disentuh dalam rentang ini (detik) tidak ikut dibuang _prune
+MIN_AGE = 300
+XLSX_MAX_ROWS = 1_048_575
+
+# label -> (ekstensi, MIME, modul yang dibutuhkan)
+FORMATS = {
+    'CSV': ('csv', 'text/csv', None),
+    'XLSX': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'openpyxl'),
+    'Parquet': ('parquet', 'application/vnd.apache.parquet', 'pyarrow'),
+}
+
+
+def available():
+    """Format yang bisa dibuat di instalasi ini."""
+    return [label for label, (_, _, module) in FORMATS.items()
+            if module is None or importlib.util.find_spec(module) is not None]
+
+
+def _chunks(df):
+    for start in range(0, len(df), CHUNK_ROWS):
+        yield df.iloc[start:start + CHUNK_ROWS]
+
+
+def _write_csv(df, f):
+    f.write(df.iloc[:0].to_csv(index=False).encode())
+    for chunk in _chunks(df):
+        f.write(chunk.to_csv(index=False, header=False).encode())
+
+
+def _write_xlsx(df, f, sheet):
+    from openpyxl import Workbook
+
+    if len(df) > XLSX_MAX_ROWS:
+        raise ValueError(f'{len(df)} baris melebihi batas Excel, pakai CSV atau Parquet')
+    # Mode write-only menulis baris langsung ke stream, tanpa model sel di memori
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet[:31])
+    ws.append(list(df.columns))
+    for chunk in _chunks(df):
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        for row in chunk.itertuples(index=False, name=None):
+            ws.append(row)
+    wb.save(f)
+
+
+def _write_parquet(df, f):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.Schema.from_pandas(df.iloc[:0], preserve_index=False)
+    with pq.ParquetWriter(f, schema) as writer:
+        for chunk in _chunks(df):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def _prune(export_dir):
+    now = time.time()
+    files = []
+    for path in export_dir.iterdir():
+        if path.suffix == '.tmp':
+            continue
+        try:
+            files.append((path.stat().st_mtime, path))
+        except FileNotFoundError:
+            continue  # sudah dibuang sesi lain
+    files.sort(reverse=True)
+    for mtime, path in files[MAX_FILES:]:
+        if now - mtime > MIN_AGE:
+            path.unlink(missing_ok=True)
+
+
+def path(stem, parts, load, fmt, export_dir=None):
+    """File export ``fmt`` untuk filter ``parts``; ``load()`` hanya dipanggil kalau belum ada di cache."""
+    ext, _, _ = FORMATS[fmt]
+    export_dir = Path(export_dir or EXPORT_DIR)
+    digest = hashlib.sha1(repr((stem, parts, fmt)).encode()).hexdigest()[:20]
+    target = export_dir / f'{digest}.{ext}'
+    try:
+        # utime sekaligus cek keberadaan, tanpa jeda exists() -> utime() yang bisa didahului _prune
+        os.utime(target)
+        return target
+    except FileNotFoundError:
+        pass
+
+    with instrumentation.span(f'export_{ext}'):
+        df = load()
+        export_dir.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f'{target.name}.{os.getpid()}.tmp')
+        with open(tmp, 'wb') as f:
+            if fmt == 'CSV':
+                _write_csv(df, f)
+            elif fmt == 'XLSX':
+                _write_xlsx(df, f, stem)
+            else:
+                _write_parquet(df, f)
+        os.replace(tmp, target)
+    _prune(export_dir)
+    return target
+
+
+def _open(stem, parts, load, fmt):
+    # Dipanggil Streamlit saat tombol diklik; handle-nya dibaca Streamlit sendiri,
+    # jadi export tidak pernah dimuat utuh oleh kode kita. Handle yang sudah
+    # terbuka tetap terbaca walau file-nya dibuang _prune proses lain.
+    try:
+        return open(path(stem, parts, load, fmt), 'rb')
+    except FileNotFoundError:
+        # Dibuang proses lain di antara path() dan open(): bangun ulang sekali
+        return open(path(stem, parts, load, fmt), 'rb')
+
+
+def buttons(stem, parts, load, key, rows):
+    """Tombol unduh untuk setiap format; ``parts`` mengidentifikasi data + filter (termasuk versi data).
+
+    ``rows`` adalah jumlah baris tabel; tombol XLSX dimatikan kalau melewati batas Excel.
+    """
+    formats = available()
+    too_long = rows > XLSX_MAX_ROWS
+    for col, fmt in zip(st.columns(len(formats)), formats):
+        ext, mime, _ = FORMATS[fmt]
+        col.download_button(fmt, data=partial(_open, stem, parts, load, fmt), file_name=f'{stem}.{ext}',
+                            mime=mime, key=f'{key}_{ext}', on_click='ignore', icon=':material/download:',
+                            disabled=fmt == 'XLSX' and too_long)
+    if too_long and 'XLSX' in formats:
+        st.caption(f'{rows:,} baris melebihi batas Excel ({XLSX_MAX_ROWS:,} baris), unduh sebagai CSV atau Parquet.')
+
+
+def _indicator_table(name, region, span, columns):
+    return downsample.window(data.load(name, columns=columns, region=region), span, 'Date')
+
+
+def indicator_buttons(name, region=data.NATIONAL, span=None, columns=None, key=None):
+    """Tombol unduh tabel indikator ``name`` untuk wilayah dan rentang periode yang dipilih.
+
+    ``columns`` membatasi kolom yang diunduh ke seri yang sedang tampil (default: semua kolom).
+    """
+    columns = tuple(columns) if columns is not None else None
+    stem = name if region == data.NATIONAL else f'{name}_{region}'
+    parts = (name, data.data_version(name, region), region, span, columns)
+    load = partial(_indicator_table, name, region, span, columns)
+    # Slice dari frame yang sudah di cache; hanya untuk menghitung baris
+    buttons(stem, parts, load, key or f'export_{name}', len(load()))
@@ -0,0 +1,212 @@
+"""Ambil tabel indikator dari WebAPI BPS ke file sumber dan store.
+
+Setiap indikator di ``SOURCES`` dipetakan ke variabel tabel dinamis BPS. Semua
+variabel diunduh paralel di thread pool lewat satu ``requests.Session`` dengan
+pool koneksi keep-alive. Respons terakhir disimpan di ``bps_cache/`` (env
+``DASHBOARD_BPS_CACHE``) bersama ``ETag``/``Last-Modified``-nya. Request
+berikutnya bersifat kondisional, jadi tabel yang tidak berubah dijawab 304 dan
+tidak diunduh ulang. Indikator yang variabelnya berubah ditulis ulang ke file
+sumbernya (hanya kalau isinya memang beda) lalu di-ingest ke store.
+
+Untuk uji tanpa jaringan, ``dashboard.bps_replay`` memutar ulang respons BPS
+yang direkam; arahkan ``DASHBOARD_BPS_URL`` ke server itu.
+
+Contoh::
+
+    export BPS_API_KEY=...
+    python -m dashboard.fetch                  # semua indikator di SOURCES
+    python -m dashboard.fetch pdb -j 4
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from dashboard import data, ingest, periods, store
+
+DEFAULT_URL = 'https://webapi.bps.go.id/v1/api'
+BASE_URL = os.environ.get('DASHBOARD_BPS_URL', DEFAULT_URL).rstrip('/')
+API_KEY = os.environ.get('BPS_API_KEY', '')
+CACHE_DIR = Path(os.environ.get('DASHBOARD_BPS_CACHE', data.ROOT_DIR / 'bps_cache'))
+WORKERS = 8
+TIMEOUT = 30
+# Domain dan wilayah (vervar) nasional di WebAPI BPS
+DOMAIN = '0000'
+VERVAR = 9999
+
+# var: ID variabel tabel dinamis BPS; turvar: turunan variabel (0 = tidak ada)
+Column = namedtuple('Column', ['var', 'turvar'])
+
+# indikator -> (frekuensi, {kolom file sumber: Column}); sesuaikan ID kalau BPS mengganti tabel
+SOURCES = {
+    'pdb': ('triwulan', {'PDB_HB': Column(1955, 0), 'PDB_HK': Column(1956, 0)}),
+    'kemiskinan': ('semester', {'Jumlah_Miskin': Column(183, 0), 'Persentase_Miskin': Column(192, 0),
+                                'Gini_Ratio': Column(98, 0)}),
+    'ipm': ('tahunan', {'IPM_Laki_laki': Column(413, 1), 'IPM_Perempuan': Column(413, 2)}),
+}
+
+# Label turunan tahun (turtahun) BPS -> nilai kolom periode; label lain (mis. total tahunan) dilewati
+TURTAHUN = {
+    'triwulan': {f'Triwulan {roman}': roman for roman in periods.TRIWULAN_MONTH},
+    'semester': {'Semester 1 (Maret)': 'Maret', 'Semester 2 (September)': 'September'},
+    'tahunan': {'Tahun': None},
+}
+
+_YEAR = re.compile(r'\d{4}')
+
+
+def url(var):
+    return f'{BASE_URL}/list/model/data/lang/ind/domain/{DOMAIN}/var/{var}/key/{API_KEY}/'
+
+
+def redact(text):
+    """``text`` tanpa API key; URL request (dengan key di path) ikut tercetak di pesan error."""
+    return text.replace(API_KEY, '***') if API_KEY else text
+
+
+def session(workers=WORKERS):
+    """Satu session untuk semua thread, pool koneksinya cukup untuk ``workers``."""
+    sess = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    sess.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=workers, max_retries=retry))
+    sess.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=workers, max_retries=retry))
+    return sess
+
+
+def _cache_paths(var, cache_dir):
+    cache_dir = Path(cache_dir or CACHE_DIR)
+    return cache_dir / f'{var}.json', cache_dir / f'{var}.headers.json'
+
+
+def _write_atomic(path, payload):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+
+def read_cached(var, cache_dir=None):
+    body, _ = _cache_paths(var, cache_dir)
+    return json.loads(body.read_text())
+
+
+def fetch_var(sess, var, cache_dir=None, force=False):
+    """Unduh variabel ``var`` kalau berubah sejak respons di cache; True kalau diunduh."""
+    body, headers = _cache_paths(var, cache_dir)
+    conditional = {}
+    if not force and body.exists() and headers.exists():
+        validators = json.loads(headers.read_text())
+        if validators.get('etag'):
+            conditional['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            conditional['If-Modified-Since'] = validators['last_modified']
+
+    response = sess.get(url(var), headers=conditional, timeout=TIMEOUT)
+    if response.status_code == 304:
+        return False
+    response.raise_for_status()
+    payload = response.json()
+    if payload.get('data-availability') != 'available':
+        raise ValueError(f"var {var}: {payload.get('data-availability') or payload.get('message')}")
+
+    _write_atomic(body, response.content)
+    _write_atomic(headers, json.dumps({'etag': response.headers.get('ETag'),
+                                       'last_modified': response.headers.get('Last-Modified')}).encode())
+    return True
+
+
+def table(name, payloads):
+    """Tabel sumber ``name`` (format file di ``data/``) dari respons BPS per variabel."""
+    kind, columns = SOURCES[name]
+    keys = periods.SOURCE_KEYS[kind]
+    labels = TURTAHUN[kind]
+    rows = {}
+    for column, (var, turvar) in columns.items():
+        payload = payloads[var]
+        content = payload['datacontent']
+        for tahun in payload['tahun']:
+            year = int(_YEAR.search(tahun['label']).group())
+            for turtahun in payload['turtahun']:
+                if turtahun['label'] not in labels:
+                    continue
+                value = content.get(f"{VERVAR}{var}{turvar}{tahun['val']}{turtahun['val']}")
+                if value is None:
+                    continue
+                period = (year, labels[turtahun['label']])[:len(keys)]
+                rows.setdefault(period, {})[column] = float(value)
+
+    df = pd.DataFrame([dict(zip(keys, period), **values) for period, values in rows.items()],
+                      columns=[*keys, *columns])
+    df = df.sort_values(keys, key=periods.period_key, kind='stable').reset_index(drop=True)
+    return df.astype({'Tahun': 'int64', **{c: 'float64' for c in columns}})
+
+
+def write_source(name, df):
+    """Tulis ``df`` ke file sumber ``name``; False kalau isinya sama dengan file sekarang."""
+    (path,), _ = data.INDICATORS[name]
+    if path.exists() and pd.read_csv(path).equals(df):
+        return False
+    _write_atomic(path, df.to_csv(index=False).encode())
+    return True
+
+
+def fetch(names=None, store_dir=None, workers=WORKERS, cache_dir=None, force=False):
+    """Perbarui indikator ``names`` dari BPS.
+
+    Mengembalikan (variabel yang diunduh, {indikator: jumlah baris, None kalau tidak berubah}).
+    """
+    if BASE_URL == DEFAULT_URL and not API_KEY:
+        raise ValueError('BPS_API_KEY belum diisi')
+    names = list(names or SOURCES)
+    variables = sorted({var for name in names for var, _ in SOURCES[name][1].values()})
+    with session(workers) as sess, ThreadPoolExecutor(max_workers=workers) as pool:
+        downloaded = dict(zip(variables, pool.map(lambda var: fetch_var(sess, var, cache_dir, force), variables)))
+
+    results = {}
+    for name in names:
+        used = {var for var, _ in SOURCES[name][1].values()}
+        (path,), _ = data.INDICATORS[name]
+        results[name] = None
+        if force or not path.exists() or any(downloaded[var] for var in used):
+            df = table(name, {var: read_cached(var, cache_dir) for var in used})
+            if write_source(name, df):
+                results[name] = len(df)
+        # Store ikut diperbarui walau file sumber tidak berubah tapi store-nya basi
+        ingest.ingest(name, store_dir)
+    return [var for var, new in downloaded.items() if new], results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m dashboard.fetch', description=__doc__.splitlines()[0])
+    parser.add_argument('names', nargs='*', help='indikator yang diambil (default: semua di SOURCES)')
+    parser.add_argument('--store', default=None, help=f'direktori store (default: {store.STORE_DIR})')
+    parser.add_argument('-j', '--jobs', type=int, default=WORKERS, help=f'jumlah request paralel (default: {WORKERS})')
+    parser.add_argument('--cache', default=None, help=f'direktori respons BPS (default: {CACHE_DIR})')
+    parser.add_argument('--force', action='store_true', help='unduh ulang tanpa request kondisional')
+    args = parser.parse_args(argv)
+
+    unknown = [n for n in args.names if n not in SOURCES]
+    if unknown:
+        parser.error(f"indikator tidak punya sumber BPS: {', '.join(unknown)}")
+    try:
+        downloaded, results = fetch(args.names, args.store, args.jobs, args.cache, args.force)
+    except (requests.RequestException, ValueError) as exc:
+        print(f'gagal: {redact(str(exc))}', file=sys.stderr)
+        return 1
+    for name, rows in results.items():
+        print(f"{name}: {'tidak berubah' if rows is None else str(rows) + ' baris'}")
+    print(f'{len(downloaded)} variabel diunduh')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
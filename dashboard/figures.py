@@ -0,0 +1,125 @@
+"""Cache figure Plotly per proses dengan eviction LRU.
+
+Key cache: (tab, nama chart, versi data, parameter layout). Figure yang sama
+dipakai bersama oleh semua sesi, jadi jangan diubah setelah diambil dari cache.
+Saat miss, cache hangat di disk (``dashboard.warm``) dicek sebelum build.
+"""
+import threading
+from collections import OrderedDict
+
+import plotly.io as pio
+
+from dashboard import instrumentation, payload, warm
+
+MAX_ENTRIES = 64
+MAX_BYTES = 64 * 1024 * 1024
+
+
+class CachedFigure:
+    def __init__(self, figure, text=None):
+        # Figure dari JSON cache hangat sudah diringkas saat prebuild
+        self.figure = payload.compact(figure) if text is None else figure
+        # JSON dibuat sekali saat build; ukurannya dipakai untuk batas cache
+        self.json = pio.to_json(self.figure, validate=False) if text is None else text
+        self.nbytes = len(self.json)
+        # Dicatat charts.plotly_chart tanpa serialisasi ulang
+        self.figure._payload_bytes = self.nbytes
+
+    @classmethod
+    def from_json(cls, text):
+        return cls(pio.from_json(text, skip_invalid=True), text)
+
+
+class FigureCache:
+    def __init__(self, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+            self._entries[key] = entry
+            self.nbytes += entry.nbytes
+            while self._entries and (len(self._entries) > self.max_entries or self.nbytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+
+    def discard(self, predicate):
+        """Buang semua entri yang key-nya memenuhi ``predicate``."""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                self.nbytes -= self._entries.pop(key).nbytes
+
+    def get_or_build(self, key, build, stale=None):
+        """Entri ``key``; saat miss, entri yang memenuhi ``stale`` dibuang sebelum build."""
+        entry = self.get(key)
+        if entry is None:
+            if stale is not None:
+                self.discard(stale)
+            text = warm.load_figure(key)
+            if text is not None:
+                with instrumentation.span('figure_warm_load'):
+                    try:
+                        entry = CachedFigure.from_json(text)
+                    except ValueError:
+                        pass  # JSON rusak di cache hangat dianggap miss
+            if entry is None:
+                # Build di luar lock; dua sesi yang miss bersamaan hanya build dua kali
+                with instrumentation.span('figure_build'):
+                    entry = CachedFigure(build())
+                warm.save_figure(key, entry.json)
+            self.put(key, entry)
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_cache = FigureCache()
+
+
+def get_cache():
+    return _cache
+
+
+def get_entry(tab, name, version, build, **params):
+    key = (tab, name, version, tuple(sorted(params.items())))
+    region = params.get('region')
+
+    def stale(k):
+        # Versi data baru (mis. rilis yang di-append): entri chart ini untuk versi lama
+        # di wilayah yang sama tidak terpakai lagi. Wilayah lain punya versi sendiri.
+        return k[:2] == (tab, name) and k[2] != version and dict(k[3]).get('region') == region
+
+    return _cache.get_or_build(key, lambda: build(**params), stale=stale)
+
+
+def get_figure(tab, name, version, build, **params):
+    """Figure dari cache, atau ``build(**params)`` kalau belum ada untuk versi data ini."""
+    return get_entry(tab, name, version, build, **params).figure
+
+
+def get_json(tab, name, version, build, **params):
+    return get_entry(tab, name, version, build, **params).json
@@ -0,0 +1,52 @@
+"""Konversi file sumber indikator ke store Parquet.
+
+Contoh::
+
+    python -m dashboard.ingest                 # semua indikator terdaftar
+    python -m dashboard.ingest pdb kemiskinan
+    python -m dashboard.ingest --csv export_bps.csv --name pdrb_provinsi
+"""
+import argparse
+import sys
+
+from dashboard import data, store
+
+
+def ingest(name, store_dir=None, force=False):
+    version = data.data_version(name)
+    if not force and store.has(name, version, store_dir):
+        return None
+    return store.write(name, data.parse(name), version, store_dir)
+
+
+def ingest_csv(path, name, store_dir=None):
+    return store.write(name, data.parse_table(path), data.file_digest(path), store_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m dashboard.ingest', description=__doc__.splitlines()[0])
+    parser.add_argument('names', nargs='*', help='indikator yang di-ingest (default: semua)')
+    parser.add_argument('--store', default=None, help=f'direktori store (default: {store.STORE_DIR})')
+    parser.add_argument('--force', action='store_true', help='tulis ulang walau versi sumber tidak berubah')
+    parser.add_argument('--csv', help='export BPS tambahan yang tidak terdaftar di INDICATORS')
+    parser.add_argument('--name', help='nama dataset untuk --csv')
+    args = parser.parse_args(argv)
+
+    if args.csv:
+        if not args.name:
+            parser.error('--csv butuh --name')
+        meta = ingest_csv(args.csv, args.name, args.store)
+        print(f"{args.name}: {meta['rows']} baris")
+        return 0
+
+    unknown = [n for n in args.names if n not in data.INDICATORS]
+    if unknown:
+        parser.error(f"indikator tidak dikenal: {', '.join(unknown)}")
+    for name in args.names or data.INDICATORS:
+        meta = ingest(name, args.store, args.force)
+        print(f"{name}: {'tidak berubah' if meta is None else str(meta['rows']) + ' baris'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
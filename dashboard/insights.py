@@ -0,0 +1,273 @@
+"""Insight dari data: ekstrem, titik balik, durasi pemulihan, tren dan delta terakhir.
+
+``SeriesSummary`` meringkas satu seri dalam satu lintasan vektorisasi dan
+bisa diperpanjang dengan periode baru (``extend``) tanpa membaca ulang
+histori. ``summary()`` menyimpan ringkasan per versi data dengan
+``st.cache_resource``. Kalau versi baru hanya menambah periode di belakang
+(hash semua baris yang sudah diringkas masih sama), hanya periode baru yang
+diproses; revisi histori membuat ringkasan dibangun ulang dari awal.
+Ringkasan hasil prebuild dibaca dari cache hangat (``dashboard.warm``).
+
+Cek regresi update inkremental (revisi + append) terhadap build penuh::
+
+    python -m dashboard.insights --check
+"""
+import argparse
+import copy
+import hashlib
+import sys
+import threading
+from collections import namedtuple
+
+import numpy as np
+import streamlit as st
+
+from dashboard import data, warm
+
+# Jumlah periode terakhir untuk tren dan rata-rata
+WINDOW = 8
+
+Point = namedtuple('Point', ['pos', 'label', 'value'])
+# Gerak merugikan dari ``start`` ke ``end`` (turun untuk seri higher_is_better),
+# ``recovered``: titik pertama setelah ``end`` yang kembali ke level ``start``
+Episode = namedtuple('Episode', ['start', 'end', 'recovered'])
+
+
+def turning_points(values, direction=0):
+    """Posisi titik balik di ``values`` dan arah terakhir (+1 naik, -1 turun).
+
+    ``direction`` adalah arah sebelum ``values[0]`` (0 kalau belum diketahui).
+    Nilai datar meneruskan arah sebelumnya.
+    """
+    sign = np.sign(np.diff(values))
+    nonzero = sign != 0
+    if not nonzero.any():
+        return np.array([], dtype=int), direction
+    # Isi arah datar dengan arah non-nol terakhir
+    last = np.maximum.accumulate(np.where(nonzero, np.arange(len(sign)), -1))
+    filled = np.where(last >= 0, sign[np.maximum(last, 0)], direction)
+    previous = np.r_[direction, filled[:-1]]
+    turns = np.flatnonzero((filled != previous) & (previous != 0) & nonzero)
+    return turns, int(filled[-1])
+
+
+def prefix_digest(labels, values):
+    """Hash baris ``labels``/``values``, untuk mendeteksi revisi histori."""
+    digest = hashlib.sha1('\x1f'.join(map(str, labels)).encode())
+    digest.update(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def trend_slope(values):
+    """Kemiringan regresi linear ``values`` per periode."""
+    values = np.asarray(values, dtype=float)
+    if len(values) < 2:
+        return 0.0
+    x = np.arange(len(values)) - (len(values) - 1) / 2
+    return float((x * (values - values.mean())).sum() / (x * x).sum())
+
+
+class SeriesSummary:
+    """Ringkasan satu seri yang bisa diperpanjang dengan periode baru."""
+
+    def __init__(self, higher_is_better=True):
+        self.higher_is_better = higher_is_better
+        self.rows = 0          # baris yang sudah diproses, termasuk nilai kosong
+        self.count = 0         # nilai valid
+        self.first = None
+        self.low = None
+        self.high = None
+        self.turns = []
+        self.episodes = []
+        self.tail = []         # WINDOW titik valid terakhir
+        self.digest = prefix_digest([], [])  # hash baris yang sudah diproses, untuk deteksi append
+        self._direction = 0
+
+    @property
+    def latest(self):
+        return self.tail[-1] if self.tail else None
+
+    @property
+    def previous(self):
+        return self.tail[-2] if len(self.tail) > 1 else None
+
+    @property
+    def delta(self):
+        return self.latest.value - self.previous.value if self.previous else None
+
+    @property
+    def slope(self):
+        return trend_slope([p.value for p in self.tail])
+
+    @property
+    def mean(self):
+        return float(np.mean([p.value for p in self.tail])) if self.tail else None
+
+    def worst_episode(self):
+        """Gerak merugikan terbesar (dari titik balik ke titik balik)."""
+        if not self.episodes:
+            return None
+        return max(self.episodes, key=lambda e: abs(e.end.value - e.start.value))
+
+    def next_turn(self, point):
+        """Titik balik pertama setelah ``point``, misalnya puncak rebound setelah palung."""
+        return next((t for t in self.turns if t.pos > point.pos), None)
+
+    def extends(self, labels, values):
+        """True kalau ``labels``/``values`` adalah seri yang sama ditambah periode baru.
+
+        Seluruh baris yang sudah diringkas dibandingkan lewat hash, jadi revisi
+        nilai lama (mis. BPS merevisi histori) tidak lolos sebagai append.
+        """
+        if self.rows == 0 or len(labels) < self.rows:
+            return False
+        return prefix_digest(labels[:self.rows], values[:self.rows]) == self.digest
+
+    def extend(self, labels, values):
+        """Ringkasan seri penuh ``labels``/``values``; hanya baris setelah ``rows`` yang diproses.
+
+        Pemanggil memastikan ``extends(labels, values)``. ``self`` tidak diubah.
+        """
+        labels, values = np.asarray(labels, dtype=object), np.asarray(values, dtype=float)
+        new = copy.copy(self)
+        new.turns, new.episodes, new.tail = list(self.turns), list(self.episodes), list(self.tail)
+        new._update(labels[self.rows:], values[self.rows:])
+        new.digest = prefix_digest(labels, values)
+        return new
+
+    def _update(self, labels, values):
+        if len(values) == 0:
+            return
+        self.rows += len(values)
+        valid = ~np.isnan(values)
+        labels, values = labels[valid], values[valid]
+        if len(values) == 0:
+            return
+        pos = np.arange(self.count, self.count + len(values))
+        self.count += len(values)
+
+        def point(i):
+            return Point(int(pos[i]), labels[i], float(values[i]))
+
+        if self.first is None:
+            self.first = point(0)
+        i_low, i_high = values.argmin(), values.argmax()
+        if self.low is None or values[i_low] < self.low.value:
+            self.low = point(i_low)
+        if self.high is None or values[i_high] > self.high.value:
+            self.high = point(i_high)
+
+        # Titik balik: sambung dengan titik valid terakhir supaya batas chunk ikut dinilai
+        if self.tail:
+            head = self.tail[-1]
+            ext_values = np.r_[head.value, values]
+            turns, self._direction = turning_points(ext_values, self._direction)
+            new_turns = [head if t == 0 else point(t - 1) for t in turns]
+        else:
+            turns, self._direction = turning_points(values, self._direction)
+            new_turns = [point(t) for t in turns]
+        for turn in new_turns:
+            if self.turns:
+                start = self.turns[-1]
+                adverse = turn.value < start.value if self.higher_is_better else turn.value > start.value
+                if adverse:
+                    self.episodes.append(Episode(start, turn, None))
+            self.turns.append(turn)
+
+        # Pemulihan episode yang belum pulih, dicari hanya di periode baru
+        for i, episode in enumerate(self.episodes):
+            if episode.recovered is not None:
+                continue
+            after = pos > episode.end.pos
+            if self.higher_is_better:
+                back = after & (values >= episode.start.value)
+            else:
+                back = after & (values <= episode.start.value)
+            hits = np.flatnonzero(back)
+            if len(hits):
+                self.episodes[i] = episode._replace(recovered=point(hits[0]))
+
+        self.tail = (self.tail + [point(i) for i in range(max(0, len(values) - WINDOW), len(values))])[-WINDOW:]
+
+
+_lock = threading.Lock()
+# (indikator, kolom, wilayah) -> ringkasan terakhir, titik awal update inkremental
+_latest = {}
+
+
+@st.cache_resource(show_spinner=False, max_entries=128)
+def _summary(name, column, label, region, version, higher_is_better):
+    key = (name, column, label, region, higher_is_better)
+    result = warm.load_summary((*key, version))
+    if result is None:
+        df = data.load(name, columns=[label, column], region=region)
+        labels, values = df[label].to_numpy(dtype=object), df[column].to_numpy(dtype=float)
+        with _lock:
+            base = _latest.get(key)
+        if base is None or not base.extends(labels, values):
+            base = SeriesSummary(higher_is_better)
+        result = base.extend(labels, values)
+        warm.save_summary((*key, version), result)
+    with _lock:
+        _latest[key] = result
+    return result
+
+
+def summary(name, column, label='Period', region=data.NATIONAL, higher_is_better=True):
+    """``SeriesSummary`` kolom ``column`` indikator ``name`` untuk versi data saat ini."""
+    return _summary(name, column, label, region, data.data_version(name, region), higher_is_better)
+
+
+def check(name, column, label='Period', higher_is_better=True):
+    """Masalah update inkremental seri ``name``/``column``: append biasa dan revisi + append.
+
+    Hasil inkremental dibandingkan dengan ringkasan yang dibangun penuh.
+    """
+    df = data.load(name, columns=[label, column])
+    labels, values = df[label].to_numpy(dtype=object), df[column].to_numpy(dtype=float)
+    valid = np.flatnonzero(~np.isnan(values))
+    if len(valid) < 3:
+        return []
+    revised = values.copy()
+    revised[valid[len(valid) // 2]] += 1.0
+    base = SeriesSummary(higher_is_better).extend(labels[:-1], values[:-1])
+
+    problems = []
+    for case, new_values in (('append', values), ('revisi + append', revised)):
+        fresh = SeriesSummary(higher_is_better).extend(labels, new_values)
+        start = base if base.extends(labels, new_values) else SeriesSummary(higher_is_better)
+        if vars(start.extend(labels, new_values)) != vars(fresh):
+            problems.append(f'{name}.{column}: {case} berbeda dari build penuh')
+    if not base.extends(labels, values) or base.extends(labels, revised):
+        problems.append(f'{name}.{column}: deteksi append salah')
+    return problems
+
+
+# (indikator, kolom, label, higher_is_better) yang dipakai insight tab
+CHECKS = [
+    ('pdb', 'PDB_HK', 'Period', True),
+    ('pdb', 'y_o_y', 'Period', True),
+    ('kemiskinan', 'Persentase_Miskin', 'Period', False),
+    ('kemiskinan', 'Gini_Ratio', 'Period', False),
+    ('ipm', 'IPM_Total', 'Tahun', True),
+    ('ipm', 'Gender_Gap', 'Tahun', False),
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m dashboard.insights', description=__doc__.splitlines()[0])
+    parser.add_argument('--check', action='store_true', help='cek update inkremental (append, revisi + append)')
+    args = parser.parse_args(argv)
+    if not args.check:
+        parser.print_help()
+        return 0
+
+    problems = [problem for spec in CHECKS for problem in check(*spec)]
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    print(f"{len(CHECKS)} seri, {len(problems) or 'tidak ada'} masalah")
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""Span waktu ringan untuk hot path script.
+
+Setiap ``span(name)`` dicatat di tiga tempat: daftar span run terakhir dan
+agregat per sesi (di ``st.session_state``), serta agregat per proses untuk
+ekspor format teks Prometheus. Ukuran payload setiap chart dicatat dengan
+``record_payload``. Panel diagnostik tampil dengan query
+parameter ``?diagnostics=1``; file metrik ditulis kalau env
+``DASHBOARD_METRICS_FILE`` diisi.
+"""
+import bisect
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from dashboard import profiling
+
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+METRICS_FILE = os.environ.get('DASHBOARD_METRICS_FILE')
+METRICS_INTERVAL = 5.0
+
+_RUN_KEY = '_diag_run_spans'
+_SESSION_KEY = '_diag_session_spans'
+_PAYLOAD_KEY = '_diag_run_payloads'
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_process = {}
+# nama chart -> ukuran payload terakhir (byte)
+_payloads = {}
+_last_write = 0.0
+
+
+class _Stat:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+
+    def as_row(self, name):
+        return {'span': name, 'count': self.count, 'total_ms': self.total * 1000,
+                'mean_ms': self.total / self.count * 1000 if self.count else 0.0,
+                'max_ms': self.max * 1000}
+
+
+def _session_state():
+    # Di luar script run (CLI, worker) tidak ada sesi
+    return st.session_state if get_script_run_ctx() is not None else None
+
+
+def begin_run():
+    state = _session_state()
+    if state is not None:
+        state[_RUN_KEY] = []
+        state[_PAYLOAD_KEY] = []
+
+
+@contextmanager
+def fragment(name):
+    """Span ``fragment:<name>`` untuk isi ``st.fragment``.
+
+    Rerun yang hanya menjalankan fragment tidak melewati ``begin_run()`` di
+    ``app.py``, jadi record run terakhir dimulai ulang di sini supaya span-nya
+    tidak ditumpuk ke run sebelumnya.
+    """
+    ctx = get_script_run_ctx()
+    if ctx is not None and ctx.fragment_ids_this_run:
+        begin_run()
+    with span(f'fragment:{name}'):
+        yield
+
+
+@contextmanager
+def span(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        seconds = end - start
+        with _lock:
+            _process.setdefault(name, _Stat()).add(seconds)
+        state = _session_state()
+        if state is not None:
+            state.setdefault(_RUN_KEY, []).append((name, seconds * 1000))
+            state.setdefault(_SESSION_KEY, {}).setdefault(name, _Stat()).add(seconds)
+        profiling.record(name, start, end)
+
+
+def record_payload(chart, nbytes):
+    """Catat ukuran JSON figure ``chart`` yang dikirim ke browser."""
+    with _lock:
+        _payloads[chart] = nbytes
+    state = _session_state()
+    if state is not None:
+        state.setdefault(_PAYLOAD_KEY, []).append((chart, nbytes))
+    logger.debug('payload %s: %d bytes', chart, nbytes)
+
+
+def process_stats():
+    with _lock:
+        return [stat.as_row(name) for name, stat in sorted(_process.items())]
+
+
+def prometheus_text():
+    from dashboard import figures
+
+    lines = ['# HELP dashboard_span_seconds Durasi span hot path script.',
+             '# TYPE dashboard_span_seconds histogram']
+    with _lock:
+        for name, stat in sorted(_process.items()):
+            cumulative = 0
+            for le, n in zip(BUCKETS + ('+Inf',), stat.buckets):
+                cumulative += n
+                lines.append(f'dashboard_span_seconds_bucket{{span="{name}",le="{le}"}} {cumulative}')
+            lines.append(f'dashboard_span_seconds_sum{{span="{name}"}} {stat.total:.6f}')
+            lines.append(f'dashboard_span_seconds_count{{span="{name}"}} {stat.count}')
+    lines += ['# HELP dashboard_chart_payload_bytes Ukuran JSON chart terakhir yang dikirim.',
+              '# TYPE dashboard_chart_payload_bytes gauge']
+    with _lock:
+        for chart, nbytes in sorted(_payloads.items()):
+            label = chart.replace('\\', '\\\\').replace('"', '\\"')
+            lines.append(f'dashboard_chart_payload_bytes{{chart="{label}"}} {nbytes}')
+    cache = figures.get_cache()
+    lines += [
+        '# TYPE dashboard_figure_cache_entries gauge',
+        f'dashboard_figure_cache_entries {len(cache)}',
+        '# TYPE dashboard_figure_cache_bytes gauge',
+        f'dashboard_figure_cache_bytes {cache.nbytes}',
+        '# TYPE dashboard_figure_cache_hits_total counter',
+        f'dashboard_figure_cache_hits_total {cache.hits}',
+        '# TYPE dashboard_figure_cache_misses_total counter',
+        f'dashboard_figure_cache_misses_total {cache.misses}',
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def write_metrics(path=METRICS_FILE, force=False):
+    """Tulis metrik Prometheus ke ``path``, paling sering sekali per ``METRICS_INTERVAL`` detik."""
+    global _last_write
+    if not path:
+        return
+    now = time.monotonic()
+    if not force and now - _last_write < METRICS_INTERVAL:
+        return
+    _last_write = now
+    path = Path(path)
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_text(prometheus_text())
+    tmp.replace(path)
+
+
+def render_panel():
+    """Panel diagnostik, hanya kalau URL berisi ``?diagnostics=1``."""
+    if st.query_params.get('diagnostics') not in ('1', 'true'):
+        return
+    import pandas as pd
+
+    from dashboard import figures
+
+    state = st.session_state
+    with st.expander('Diagnostics', expanded=True):
+        run_col, session_col, process_col = st.columns(3)
+        with run_col:
+            st.markdown('**Run terakhir**')
+            st.dataframe(pd.DataFrame(state.get(_RUN_KEY, []), columns=['span', 'ms']), hide_index=True)
+            st.dataframe(pd.DataFrame(state.get(_PAYLOAD_KEY, []), columns=['chart', 'bytes']),
+                         hide_index=True)
+        with session_col:
+            st.markdown('**Sesi ini**')
+            rows = [stat.as_row(name) for name, stat in sorted(state.get(_SESSION_KEY, {}).items())]
+            st.dataframe(pd.DataFrame(rows), hide_index=True)
+        with process_col:
+            st.markdown('**Proses**')
+            st.dataframe(pd.DataFrame(process_stats()), hide_index=True)
+        cache = figures.get_cache()
+        st.caption(f'Figure cache: {len(cache)} entri, {cache.nbytes / 1024:.0f} KB, '
+                   f'{cache.hits} hit / {cache.misses} miss')
@@ -0,0 +1,56 @@
+"""Metrik turunan (pertumbuhan, deflator) dan bucket warna, semuanya vektorisasi.
+
+Fungsi di sini menerima tabel panjang: satu baris per periode, opsional
+dikelompokkan per seri (``by``, misalnya provinsi atau sektor). Baris harus
+sudah terurut per periode di dalam setiap seri.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+# Di data bundel, PDB_HB adalah seri yang mereproduksi pertumbuhan rilis BPS
+GROWTH_LEVEL = 'PDB_HB'
+
+# Bucket warna: nilai dibandingkan ke ``edges``; side='right' berarti batas
+# bawah inklusif (x >= edge naik bucket), side='left' berarti x > edge.
+Rule = namedtuple('Rule', ['edges', 'labels', 'side'])
+
+RULES = {
+    'pdb_growth': Rule([0, 3, 5], ['lightcoral', 'lightblue', 'lightgreen', 'darkgreen'], 'right'),
+    'gini': Rule([0.385, 0.4, 0.41], ['green', 'orange', 'red', 'darkred'], 'right'),
+}
+
+
+def bucket(values, rule):
+    """Label bucket untuk setiap nilai menurut ``RULES[rule]`` (atau objek ``Rule``)."""
+    if isinstance(rule, str):
+        rule = RULES[rule]
+    idx = np.searchsorted(np.asarray(rule.edges), np.asarray(values, dtype=float), side=rule.side)
+    return np.asarray(rule.labels, dtype=object)[idx]
+
+
+def _shift(df, col, periods, by):
+    if by:
+        return df.groupby(by, sort=False)[col].shift(periods)
+    return df[col].shift(periods)
+
+
+def pct_change(df, col, periods, by=None):
+    """Perubahan persen ``col`` terhadap ``periods`` baris sebelumnya dalam seri yang sama."""
+    return (df[col] / _shift(df, col, periods, by) - 1) * 100
+
+
+def add_growth(df, level=GROWTH_LEVEL, by=None, freq=4):
+    """Tambah kolom y_o_y, q_to_q, c_to_c dan deflator ke tabel triwulanan ``df``.
+
+    ``freq`` adalah jumlah periode per tahun. c-to-c membandingkan kumulatif
+    sejak awal tahun dengan kumulatif periode yang sama tahun sebelumnya.
+    """
+    by = [by] if isinstance(by, str) else list(by or [])
+    df = df.copy()
+    df['y_o_y'] = pct_change(df, level, freq, by)
+    df['q_to_q'] = pct_change(df, level, 1, by)
+    df['_cum'] = df.groupby(by + ['Tahun'], sort=False)[level].cumsum()
+    df['c_to_c'] = pct_change(df, '_cum', freq, by)
+    df['deflator'] = df['PDB_HK'] / df['PDB_HB'] * 100
+    return df.drop(columns='_cum')
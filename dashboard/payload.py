@@ -0,0 +1,130 @@
+"""Payload Plotly yang ringkas untuk koneksi lambat.
+
+``compact(fig)`` dijalankan sekali sebelum figure dikirim (untuk figure di
+cache: saat build):
+
+* trace scatter dengan lebih dari ``GL_THRESHOLD`` titik diganti ``Scattergl``;
+* array float dibulatkan ke presisi yang tampil di hovertemplate lalu disimpan
+  sebagai float32 (typed array) kalau galatnya di bawah presisi tampilan;
+* tanggal tanpa jam dikirim sebagai ``YYYY-MM-DD``;
+* ``text``/``customdata`` yang isinya sama dengan ``x``/``y`` dibuang dan
+  hovertemplate merujuk ``%{x}``/``%{y}`` langsung;
+* template hanya membawa default untuk tipe trace yang dipakai figure.
+"""
+import re
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+GL_THRESHOLD = 1000
+
+# %{y:.2f}, %{customdata[0]:,.1f}, %{x:.1%} -> jumlah digit desimal per variabel
+_FORMAT = re.compile(r'%\{(\w+)(?:\[\d+\])?:[^}|]*?\.(\d+)([fe%])\}')
+_DATA_ARRAYS = ('x', 'y', 'customdata')
+
+
+def _decimals(trace):
+    decimals = {}
+    for name, digits, kind in _FORMAT.findall(getattr(trace, 'hovertemplate', None) or ''):
+        # Format persen mengalikan 100, jadi butuh dua digit lagi
+        digits = int(digits) + (2 if kind == '%' else 0)
+        decimals[name] = max(decimals.get(name, 0), digits)
+    return decimals
+
+
+def _compact_array(values, decimals=None):
+    """Array ringkas untuk ``values``, atau None kalau tidak bisa diringkas."""
+    a = np.asarray(values)
+    if a.dtype.kind == 'M':
+        days = a.astype('datetime64[D]')
+        return np.datetime_as_string(days) if (days == a).all() else None
+    if a.dtype.kind != 'f':
+        return None
+    if decimals is not None:
+        a = np.round(a, decimals)
+    a32 = a.astype(np.float32)
+    tolerance = 0.5 * 10.0 ** -decimals if decimals is not None else np.abs(a) * 1e-6
+    with np.errstate(invalid='ignore'):
+        exact = (np.abs(a32 - a) <= tolerance) | np.isnan(a)
+    return a32 if exact.all() else a
+
+
+def _as_str(values):
+    a = np.asarray(values)
+    if a.dtype.kind == 'M':
+        # Bandingkan tanggal dalam bentuk yang akan dikirim
+        dates = _compact_array(a)
+        a = dates if dates is not None else a
+    return a.astype(str)
+
+
+def _same(a, b):
+    if a is None or b is None:
+        return False
+    a, b = _as_str(a), _as_str(b)
+    return a.shape == b.shape and np.array_equal(a, b)
+
+
+def _dedupe(trace):
+    template = getattr(trace, 'hovertemplate', None)
+    if not template:
+        return
+    for name in ('text', 'customdata'):
+        values = getattr(trace, name, None)
+        # text yang ditampilkan di chart (mode 'text', label bar) tetap dikirim
+        if values is None or (name == 'text' and (trace.type not in ('scatter', 'scattergl')
+                                                  or 'text' in (trace.mode or ''))):
+            continue
+        for axis in ('x', 'y'):
+            if _same(values, getattr(trace, axis, None)):
+                trace[name] = None
+                template = template.replace('%{' + name, '%{' + axis)
+                break
+    trace.hovertemplate = template
+
+
+def _to_gl(trace):
+    values = trace.x if trace.x is not None else trace.y
+    if trace.type != 'scatter' or values is None or len(values) <= GL_THRESHOLD:
+        return trace
+    spec = trace.to_plotly_json()
+    spec.pop('type')
+    # Properti yang tidak didukung Scattergl (line.shape spline, cliponaxis, ...) dibuang
+    return go.Scattergl(spec, skip_invalid=True)
+
+
+def _prune_template(fig):
+    template = fig.layout.template
+    if template is None:
+        return
+    used = {trace.type for trace in fig.data}
+    data = {kind: traces for kind, traces in template.data.to_plotly_json().items() if kind in used}
+    fig.layout.template = go.layout.Template(layout=template.layout, data=data)
+
+
+def compact(fig):
+    """Ringkas ``fig`` untuk dikirim ke browser; mengembalikan figure (bisa objek baru)."""
+    for trace in fig.data:
+        _dedupe(trace)
+        decimals = _decimals(trace)
+        for name in _DATA_ARRAYS:
+            values = getattr(trace, name, None)
+            if values is None or isinstance(values, str):
+                continue
+            compacted = _compact_array(values, decimals.get(name))
+            if compacted is not None:
+                trace[name] = compacted
+    traces = [_to_gl(trace) for trace in fig.data]
+    if any(new is not old for new, old in zip(traces, fig.data)):
+        fig = go.Figure(data=traces, layout=fig.layout)
+    _prune_template(fig)
+    return fig
+
+
+def nbytes(fig):
+    return len(pio.to_json(fig, validate=False))
+
+
+def chart_name(fig):
+    return fig.layout.title.text or 'chart'
@@ -0,0 +1,136 @@
+"""Kalender periode BPS: triwulan, semester (Maret/September) dan tahunan.
+
+Periode disimpan sebagai ``pd.PeriodIndex``. Triwulan memakai freq ``Q`` dan
+tahun memakai ``Y``. Semester memakai bulan survei (freq ``M``, Maret dan
+September), sehingga setiap semester jatuh tepat di satu triwulan. Konversi
+dari kolom sumber, label dan resampling antarfrekuensi semuanya vektorisasi.
+Seri bulanan (kolom ``Bulan``) didukung untuk label dan tanggal, tapi tidak
+untuk resampling.
+"""
+import numpy as np
+import pandas as pd
+
+TRIWULAN_MONTH = {'I': 1, 'II': 4, 'III': 7, 'IV': 10}
+SEMESTER_MONTH = {'Maret': 3, 'September': 9}
+QUARTER_ROMAN = {1: 'I', 2: 'II', 3: 'III', 4: 'IV'}
+MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'Mei', 'Jun', 'Jul', 'Agu', 'Sep', 'Okt', 'Nov', 'Des']
+# Kolom kunci periode di file sumber dan urutan bulannya (Bulan sudah berupa angka)
+PERIOD_KEYS = ['Tahun', 'Triwulan', 'Semester', 'Bulan']
+PERIOD_MONTH = {'Triwulan': TRIWULAN_MONTH, 'Semester': SEMESTER_MONTH}
+
+# frekuensi -> freq pandas; urutan dari paling rapat
+FREQS = {'triwulan': 'Q', 'semester': 'M', 'tahunan': 'Y'}
+PER_YEAR = {'triwulan': 4, 'semester': 2, 'tahunan': 1}
+# Kolom sumber yang membentuk periode tiap frekuensi
+SOURCE_KEYS = {'triwulan': ['Tahun', 'Triwulan'], 'semester': ['Tahun', 'Semester'],
+               'bulanan': ['Tahun', 'Bulan'], 'tahunan': ['Tahun']}
+
+_ROMAN = np.array(['', 'I', 'II', 'III', 'IV'], dtype=object)
+_QUARTER = {roman: q for q, roman in QUARTER_ROMAN.items()}
+_SEMESTER_NAME = np.array([{m: n for n, m in SEMESTER_MONTH.items()}.get(m, '') for m in range(13)], dtype=object)
+_MONTH_NAME = np.array([''] + MONTH_NAMES, dtype=object)
+
+
+def _years(years):
+    # from_fields tahunan butuh bulan eksplisit
+    return pd.PeriodIndex.from_fields(year=years, month=np.ones(len(years), dtype=int), freq='Y')
+
+
+def period_key(col):
+    """Key ``sort_values`` untuk kolom periode: Triwulan/Semester diurutkan per bulan."""
+    return col.map(PERIOD_MONTH[col.name]) if col.name in PERIOD_MONTH else col
+
+
+def frequency(index):
+    """Nama frekuensi (``triwulan``/``semester``/``tahunan``) dari ``PeriodIndex``."""
+    base = index.freqstr.split('-')[0]
+    for name, freq in FREQS.items():
+        if base.startswith(freq):
+            return name
+    raise ValueError(f'frekuensi tidak dikenal: {index.freqstr}')
+
+
+def source_frequency(columns):
+    """Frekuensi tabel sumber dari kolom periodenya, None kalau tidak ada kolom ``Tahun``."""
+    for kind, keys in SOURCE_KEYS.items():
+        if all(k in columns for k in keys):
+            return kind
+    return None
+
+
+def period_index(df):
+    """``PeriodIndex`` dari kolom sumber ``Tahun`` (+ ``Triwulan``, ``Semester`` atau ``Bulan``)."""
+    years = df['Tahun'].to_numpy()
+    kind = source_frequency(df.columns)
+    if kind == 'triwulan':
+        return pd.PeriodIndex.from_fields(year=years, quarter=df['Triwulan'].map(_QUARTER).to_numpy(), freq='Q')
+    if kind == 'semester':
+        return pd.PeriodIndex.from_fields(year=years, month=df['Semester'].map(SEMESTER_MONTH).to_numpy(),
+                                          freq='M')
+    if kind == 'bulanan':
+        return pd.PeriodIndex.from_fields(year=years, month=df['Bulan'].to_numpy(), freq='M')
+    return _years(years)
+
+
+def labels(index, kind=None):
+    """Label tampilan: ``2020 QII``, ``2020 Maret``, ``2020 Jan``, ``2020``.
+
+    ``kind`` wajib untuk seri bulanan (freq ``M`` dianggap semester).
+    """
+    years = pd.Index(index.year.astype(str))
+    kind = kind or frequency(index)
+    if kind == 'triwulan':
+        return years + ' Q' + _ROMAN[index.quarter]
+    if kind == 'semester':
+        return years + ' ' + _SEMESTER_NAME[index.month]
+    if kind == 'bulanan':
+        return years + ' ' + _MONTH_NAME[index.month]
+    return years
+
+
+def add_columns(df):
+    """Tambah kolom ``Period`` (label) dan ``Date`` (awal periode) ke ``df`` (in place)."""
+    index = period_index(df)
+    df['Period'] = labels(index, source_frequency(df.columns))
+    df['Date'] = index.start_time
+    return df
+
+
+def periods_in_years(years, kind):
+    """Semua periode ``kind`` di tahun ``years`` (urut)."""
+    years = np.unique(np.asarray(years))
+    if kind == 'triwulan':
+        return pd.PeriodIndex.from_fields(year=np.repeat(years, 4), quarter=np.tile([1, 2, 3, 4], len(years)),
+                                          freq='Q')
+    if kind == 'semester':
+        months = sorted(SEMESTER_MONTH.values())
+        return pd.PeriodIndex.from_fields(year=np.repeat(years, len(months)),
+                                          month=np.tile(months, len(years)), freq='M')
+    return _years(years)
+
+
+def resample(series, kind, how='mean'):
+    """``series`` ber-index ``PeriodIndex`` diubah ke frekuensi ``kind``.
+
+    Ke tahunan: agregasi ``how`` per tahun. Dari tahunan: nilai tahun dipakai di
+    setiap periodenya. Triwulan <-> semester: semester diambil dari triwulan
+    yang memuat bulan surveinya (dan sebaliknya, triwulan lain kosong).
+    """
+    source = frequency(series.index)
+    if source == kind:
+        return series
+    if kind == 'tahunan' or (source == 'semester' and kind == 'triwulan'):
+        return series.groupby(series.index.asfreq(FREQS[kind])).agg(how)
+    target = periods_in_years(series.index.year, kind)
+    parent = target.asfreq(FREQS[source])
+    return pd.Series(series.reindex(parent).to_numpy(), index=target, name=series.name)
+
+
+def coarser(a, b):
+    """Frekuensi yang lebih renggang dari ``a`` dan ``b``."""
+    return a if PER_YEAR[a] <= PER_YEAR[b] else b
+
+
+def align(left, right, kind, how='mean'):
+    """Panel dua seri pada frekuensi ``kind``, index gabungan keduanya."""
+    return pd.concat([resample(left, kind, how), resample(right, kind, how)], axis=1).sort_index()
@@ -0,0 +1,96 @@
+"""Prebuild cache hangat: figure dan insight semua tab, paralel di beberapa proses.
+
+Dijalankan saat deploy, setelah ``dashboard.ingest``/``dashboard.cube``. Setiap
+job (tab, wilayah) memanggil ``warm(region)`` modul tab (default:
+``content(region)``) di worker ``ProcessPoolExecutor``. Figure dan ringkasan
+insight yang dibangun worker ditulis ke direktori sementara. Direktori itu menggantikan ``warm/`` sekaligus
+setelah semua job selesai, jadi app yang sedang jalan tidak pernah melihat
+cache setengah jadi.
+
+Contoh::
+
+    python -m dashboard.prebuild                  # semua tab, nasional
+    python -m dashboard.prebuild --regions -j 8   # plus semua wilayah di cube regional
+"""
+import argparse
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from dashboard import data, tabs, warm
+
+
+def jobs(tab_names=None, with_regions=False):
+    """Daftar (tab, wilayah) yang dibangun; hanya tab yang punya ``content()``."""
+    result = []
+    for tab in tab_names or tabs.TABS:
+        if not hasattr(tabs.get_module(tab), 'content'):
+            continue
+        result.append((tab, data.NATIONAL))
+        names = tabs.TAB_INDICATORS.get(tab, ())
+        # Picker wilayah hanya ada di tab dengan satu indikator
+        if with_regions and len(names) == 1:
+            result += [(tab, code) for code in data.regions(names[0]) if code != data.NATIONAL]
+    return result
+
+
+def _init(target):
+    warm.enable_writes(target)
+
+
+def _run(job):
+    tab, region = job
+    start = time.perf_counter()
+    module = tabs.get_module(tab)
+    getattr(module, 'warm', module.content)(region)
+    return tab, region, time.perf_counter() - start
+
+
+def prebuild(warm_dir=None, tab_names=None, with_regions=False, workers=None):
+    """Bangun ulang cache hangat di ``warm_dir``; mengembalikan (tab, wilayah, detik) per job."""
+    target = Path(warm_dir or warm.WARM_DIR)
+    tmp = target.with_name(target.name + '.tmp')
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    todo = jobs(tab_names, with_regions)
+    # Modul tab sudah di-import di proses induk, worker mewarisinya
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init, initargs=(tmp,)) as pool:
+        results = list(pool.map(_run, todo, chunksize=max(1, len(todo) // 64)))
+
+    old = target.with_name(target.name + '.old')
+    shutil.rmtree(old, ignore_errors=True)
+    if target.exists():
+        target.rename(old)
+    tmp.rename(target)
+    shutil.rmtree(old, ignore_errors=True)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m dashboard.prebuild', description=__doc__.splitlines()[0])
+    parser.add_argument('tabs', nargs='*', help='tab yang dibangun (default: semua)')
+    parser.add_argument('--regions', action='store_true', help='juga semua wilayah di cube regional')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='jumlah proses (default: jumlah CPU)')
+    parser.add_argument('--dir', default=None, help=f'direktori cache hangat (default: {warm.WARM_DIR})')
+    args = parser.parse_args(argv)
+
+    unknown = [t for t in args.tabs if t not in tabs.TABS]
+    if unknown:
+        parser.error(f"tab tidak dikenal: {', '.join(unknown)}")
+    start = time.perf_counter()
+    results = prebuild(args.dir, args.tabs, args.regions, args.jobs)
+    target = Path(args.dir or warm.WARM_DIR)
+    counts = {kind: sum(1 for _ in (target / kind).glob('*')) for kind in (warm.FIGURES, warm.SUMMARIES)}
+    for tab in dict.fromkeys(tab for tab, _, _ in results):
+        seconds = [s for t, _, s in results if t == tab]
+        print(f'{tab}: {len(seconds)} wilayah, {sum(seconds):.1f} detik')
+    print(f"{counts[warm.FIGURES]} figure, {counts[warm.SUMMARIES]} ringkasan insight -> {target} "
+          f"({time.perf_counter() - start:.1f} detik)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
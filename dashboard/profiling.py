@@ -0,0 +1,121 @@
+"""Profil cold start: waktu import per modul dan waktu per fase script.
+
+Aktif kalau env ``DASHBOARD_PROFILE_STARTUP`` diisi (nilainya path laporan,
+atau ``1`` untuk ``startup_profile.json``) atau app dijalankan dengan
+``streamlit run app.py -- --profile-startup``. Laporan JSON ditulis sekali,
+di akhir script run pertama proses ini.
+"""
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+DEFAULT_REPORT = 'startup_profile.json'
+
+_env = os.environ.get('DASHBOARD_PROFILE_STARTUP', '')
+ENABLED = bool(_env) or '--profile-startup' in sys.argv
+REPORT_PATH = Path(_env if _env not in ('', '1') else DEFAULT_REPORT)
+
+_started = False
+_written = False
+_origin = time.perf_counter()
+_imports = {}
+_import_stack = []
+_phases = []
+_last_mark = None
+
+
+def _process_age():
+    # Umur proses dari /proc (Linux); di OS lain dihitung sejak modul ini di-import
+    try:
+        ticks = int(Path('/proc/self/stat').read_text().rsplit(')', 1)[1].split()[19])
+        uptime = float(Path('/proc/uptime').read_text().split()[0])
+        return uptime - ticks / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class _TimingLoader:
+    def __init__(self, loader):
+        self._loader = loader
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        name = module.__name__
+        _import_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            total = time.perf_counter() - start
+            children = _import_stack.pop()
+            if _import_stack:
+                _import_stack[-1] += total
+            _imports[name] = {'self_ms': (total - children) * 1000, 'cumulative_ms': total * 1000}
+
+
+class _TimingFinder:
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimingLoader(spec.loader)
+                return spec
+        return None
+
+
+def start():
+    global _started, _origin, _last_mark
+    if not ENABLED or _started:
+        return
+    _started = True
+    age = _process_age()
+    if age is not None:
+        _origin = time.perf_counter() - age
+    sys.meta_path.insert(0, _TimingFinder())
+    _last_mark = time.perf_counter()
+
+
+def mark(name):
+    """Tandai akhir fase ``name``; durasinya dihitung sejak mark sebelumnya (atau start())."""
+    global _last_mark
+    if not ENABLED or _written:
+        return
+    now = time.perf_counter()
+    _phases.append({'phase': name, 'end_ms': (now - _origin) * 1000,
+                    'duration_ms': (now - (_last_mark or now)) * 1000})
+    _last_mark = now
+
+
+def record(name, start, end):
+    """Catat fase ``name`` dari timestamp ``perf_counter`` (dipakai span instrumentation)."""
+    if not ENABLED or _written:
+        return
+    _phases.append({'phase': name, 'end_ms': (end - _origin) * 1000, 'duration_ms': (end - start) * 1000})
+
+
+def finish():
+    """Tulis laporan setelah script run pertama selesai, lalu lepas import hook."""
+    global _written
+    if not ENABLED or _written:
+        return
+    _written = True
+    sys.meta_path[:] = [f for f in sys.meta_path if not isinstance(f, _TimingFinder)]
+    imports = sorted(({'module': k, **v} for k, v in _imports.items()),
+                     key=lambda r: r['cumulative_ms'], reverse=True)
+    report = {
+        'pid': os.getpid(),
+        'time_to_first_render_ms': (time.perf_counter() - _origin) * 1000,
+        'phases': _phases,
+        'imports': imports,
+    }
+    REPORT_PATH.write_text(json.dumps(report, indent=2))
@@ -0,0 +1,40 @@
+"""Pemilih wilayah (nasional, provinsi, kabupaten/kota) untuk tab indikator."""
+import streamlit as st
+
+from dashboard import data
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _hierarchy(name, version):
+    # kode provinsi (termasuk nasional) -> kode kabupaten/kota di bawahnya
+    names = data.regions(name)
+    children = {code: [] for code in names if len(code) == 2}
+    for code in names:
+        if len(code) == 4 and code[:2] in children:
+            children[code[:2]].append(code)
+    return names, children
+
+
+def picker(name, key):
+    """Kode wilayah pilihan pengguna; ``NATIONAL`` tanpa widget kalau cube ``name`` belum ada."""
+    version = data.cube_version(name)
+    if version is None:
+        return data.NATIONAL
+    names, children = _hierarchy(name, version)
+    province_col, regency_col = st.columns(2)
+    province = province_col.selectbox('Wilayah', list(children), format_func=names.get,
+                                      key=f'{key}_provinsi')
+    if not children[province]:
+        return province
+    return regency_col.selectbox(
+        'Kabupaten/Kota', [province, *children[province]],
+        format_func=lambda code: 'Semua' if code == province else names[code],
+        key=f'{key}_kabupaten_{province}',
+    )
+
+
+def label(name, region):
+    """Nama wilayah untuk judul chart, kosong untuk nasional."""
+    if region == data.NATIONAL:
+        return ''
+    return data.regions(name).get(region, region)
@@ -0,0 +1,146 @@
+"""Dtype ringkas untuk frame indikator di memori, plus laporan footprint.
+
+``compact(df)`` dipanggil loader (``dashboard.data``) sekali per versi data,
+sebelum frame disimpan di cache bersama:
+
+* ``Triwulan``/``Semester`` jadi categorical terurut sesuai kalender;
+* label berulang (``Period``, ``Kode_Wilayah``, ``Nama_Wilayah``,
+  ``Provinsi``) jadi categorical kalau nilainya memang berulang (cube
+  regional). Teksnya tetap sama, jadi tick, hover dan ``str.split`` di tab
+  tidak berubah. ``pd.PeriodIndex`` selalu bisa dibuat dari kolom sumber
+  lewat ``periods.period_index``;
+* ``Tahun`` jadi int16 dan ``Bulan`` int8;
+* float64 jadi float32 untuk kolom turunan kontinu (pertumbuhan, deflator,
+  ...) kalau nilai yang tampil tidak berubah (lihat ``fits_float32``).
+
+Contoh::
+
+    python -m dashboard.schema              # footprint semua indikator
+    python -m dashboard.schema --cubes      # plus cube regional di store
+"""
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+from dashboard import periods
+
+# Kolom periode dengan urutan kalender
+CALENDAR = {'Triwulan': list(periods.TRIWULAN_MONTH), 'Semester': list(periods.SEMESTER_MONTH)}
+# Kolom teks berulang; kategori mengikuti urutan kemunculan (frame sudah terurut per periode)
+LABELS = ('Period', 'Nama_Wilayah', 'Provinsi')
+# Kolom yang dipakai sebagai index terurut; kategori diurutkan supaya slice label tetap jalan
+SORTED_LABELS = ('Kode_Wilayah',)
+MAX_UNIQUE_RATIO = 0.5
+INTEGERS = {'Tahun': np.int16, 'Bulan': np.int8}
+MAX_DECIMALS = 6
+FLOAT32_RTOL = 1e-6
+# Presisi terbesar yang ditampilkan tab dan insight (format .2f)
+DISPLAY_DECIMALS = 2
+
+
+def _decimals(values):
+    for d in range(MAX_DECIMALS + 1):
+        if (np.round(values, d) == values).all():
+            return d
+    return None
+
+
+def fits_float32(values):
+    """True kalau ``values`` (float64) aman disimpan sebagai float32.
+
+    Kolom dengan desimal tetap (angka rilis, mis. Gini 0.4) tetap float64
+    kecuali bilangan bulat kecil: nilainya dibandingkan dengan ambang desimal
+    di tab, dan 0.4 float32 sudah lebih besar dari 0.4. Kolom turunan yang
+    kontinu boleh float32 kalau galat relatifnya di bawah ``FLOAT32_RTOL`` dan
+    pembulatan ke presisi tampilan tidak berubah.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[np.isfinite(values)]
+    if not values.size:
+        return True
+    decimals = _decimals(values)
+    if decimals is not None:
+        return decimals == 0 and np.abs(values).max() <= 2 ** 24
+    if np.abs(values).max() > np.finfo(np.float32).max:
+        return False
+    narrowed = values.astype(np.float32).astype(np.float64)
+    return bool(np.allclose(narrowed, values, rtol=FLOAT32_RTOL, atol=0)
+                and all((np.round(narrowed, d) == np.round(values, d)).all() for d in range(DISPLAY_DECIMALS + 1)))
+
+
+def _is_text(s):
+    return pd.api.types.is_string_dtype(s.dtype) or s.dtype == object
+
+
+def _compact_column(name, s):
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return s
+    if name in CALENDAR and _is_text(s):
+        return s.astype(pd.CategoricalDtype(CALENDAR[name], ordered=True))
+    if name in LABELS + SORTED_LABELS and _is_text(s):
+        # Label yang hampir unik per baris (Period di tabel nasional) lebih kecil sebagai string
+        if s.nunique() > len(s) * MAX_UNIQUE_RATIO:
+            return s
+        if name in SORTED_LABELS:
+            return s.astype('category')
+        return s.astype(pd.CategoricalDtype(s.dropna().unique()))
+    if name in INTEGERS and pd.api.types.is_integer_dtype(s.dtype):
+        info = np.iinfo(INTEGERS[name])
+        if len(s) == 0 or (info.min <= s.min() and s.max() <= info.max):
+            return s.astype(INTEGERS[name])
+        return s
+    if s.dtype == np.float64 and fits_float32(s.to_numpy()):
+        return s.astype(np.float32)
+    return s
+
+
+def compact(df):
+    """Frame baru dengan dtype ringkas (lihat docstring modul); ``df`` tidak diubah."""
+    return pd.DataFrame({col: _compact_column(col, df[col]) for col in df.columns}, index=df.index)
+
+
+def footprint(df):
+    """Memori ``df`` dalam byte, termasuk isi string."""
+    return int(df.memory_usage(deep=True, index=False).sum())
+
+
+def report(datasets):
+    """Baris laporan (nama, baris, byte sebelum, byte sesudah) untuk ``{nama: frame}``."""
+    return [(name, len(df), footprint(df), footprint(compact(df))) for name, df in datasets.items()]
+
+
+def _datasets(names, with_cubes):
+    # data mengimpor modul ini, jadi di-import saat dipakai
+    from dashboard import data, store
+
+    for name in names:
+        yield name, data.parse(name)
+        if with_cubes and data.cube_version(name) is not None:
+            yield data.cube_name(name), store.read(data.cube_name(name))
+
+
+def main(argv=None):
+    from dashboard import data
+
+    parser = argparse.ArgumentParser(prog='python -m dashboard.schema', description=__doc__.splitlines()[0])
+    parser.add_argument('names', nargs='*', help='indikator (default: semua)')
+    parser.add_argument('--cubes', action='store_true', help='juga cube regional yang ada di store')
+    args = parser.parse_args(argv)
+
+    unknown = [n for n in args.names if n not in data.INDICATORS]
+    if unknown:
+        parser.error(f"indikator tidak dikenal: {', '.join(unknown)}")
+    rows = report(dict(_datasets(args.names or data.INDICATORS, args.cubes)))
+    print(f"{'dataset':<22}{'baris':>10}{'sebelum':>12}{'sesudah':>12}{'hemat':>8}")
+    for name, n, before, after in rows:
+        print(f'{name:<22}{n:>10}{before / 1024:>10.1f}KB{after / 1024:>10.1f}KB{1 - after / before:>8.0%}')
+    before, after = sum(r[2] for r in rows), sum(r[3] for r in rows)
+    print(f"{'total':<22}{sum(r[1] for r in rows):>10}{before / 1024:>10.1f}KB{after / 1024:>10.1f}KB"
+          f'{1 - after / before:>8.0%}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""Snapshot statis seluruh dashboard: satu halaman HTML per tab, tanpa server.
+
+Setiap halaman memuat figure dan bullet insight default tab itu (``content()``
+modul tab) dan merujuk satu salinan plotly.js di dalam bundle, jadi bundle
+bisa dibuka tanpa jaringan, langsung dari disk atau dari static file server
+mana pun. Tab dirender paralel di ``ProcessPoolExecutor``. Sidik setiap tab
+(versi data indikatornya dan versi kode ``dashboard``) dicatat di ``manifest.json``,
+dan tab yang sidiknya tidak berubah dilewati. Setiap file juga ditulis versi
+``.gz``-nya untuk server yang melayani file pra-kompresi (mis. nginx
+``gzip_static``).
+
+Contoh::
+
+    python -m dashboard.snapshot                   # ke snapshot/
+    python -m dashboard.snapshot --out /srv/www/dashboard -j 4
+"""
+import argparse
+import gzip
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import plotly
+import plotly.io as pio
+
+from dashboard import data, tabs, versions
+
+SNAPSHOT_DIR = data.ROOT_DIR / 'snapshot'
+MANIFEST_FILE = 'manifest.json'
+# Naikkan kalau template halaman berubah supaya semua tab dirender ulang
+FORMAT = 1
+PLOTLY_JS = f'plotly-{plotly.__version__}.min.js'
+
+_BOLD = re.compile(r'\*\*(.+?)\*\*')
+_ACTIVE = ' class="active"'
+
+_CSS = """
+body { font-family: sans-serif; margin: 0 1rem; color: #222; }
+header { text-align: center; padding: 5px 0; }
+.logo-title { color: navy; font-size: 28px; font-weight: bold; }
+.subtitle { color: #0070c0; font-size: 16px; }
+nav { display: flex; flex-wrap: wrap; gap: 4px; justify-content: center; margin: 0.5rem 0; }
+nav a { padding: 6px 12px; border-radius: 5px; color: #0070c0; text-decoration: none; }
+nav a.active { background-color: #0070c0; color: white; }
+main { display: flex; gap: 1rem; }
+.charts { flex: 2.5; display: flex; flex-wrap: wrap; }
+.charts > div { flex: 1 1 400px; }
+.insight-section { flex: 1; font-size: 14px; line-height: 1.2; }
+footer { color: #888; font-size: 12px; text-align: right; margin: 1rem 0; }
+"""
+
+_PAGE = """<!DOCTYPE html>
+<html lang="id">
+<head>
+<meta charset="utf-8">
+<title>{title} - Actionable Insights</title>
+<script src="{plotly_js}"></script>
+<style>{css}</style>
+</head>
+<body>
+<header><div class="logo-title">ACTIONABLE INSIGHTS</div><div class="subtitle">Generate wisdom from fingertip</div></header>
+<nav>{nav}</nav>
+<main>
+<section class="charts">
+{charts}
+</section>
+<aside class="insight-section">
+{insights}
+</aside>
+</main>
+<footer>Snapshot {generated}</footer>
+</body>
+</html>
+"""
+
+
+def page_name(tab):
+    return f'{tabs.TABS[tab]}.html'
+
+
+def fingerprint(tab):
+    """Sidik halaman ``tab``: berubah kalau data, kode dashboard, template atau daftar tab berubah."""
+    parts = {
+        'format': FORMAT,
+        'plotly': plotly.__version__,
+        'tabs': list(tabs.TABS),
+        'code': versions.code_version(),
+        'data': {name: data.data_version(name) for name in tabs.TAB_INDICATORS.get(tab, ())},
+    }
+    return hashlib.sha1(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+
+def _markdown(line):
+    # Bullet insight hanya memakai **tebal**
+    return '<p>' + _BOLD.sub(r'<strong>\1</strong>', html.escape(line)) + '</p>'
+
+
+def _write(path, text):
+    body = text.encode()
+    for target, payload in ((path, body), (path.with_name(path.name + '.gz'), gzip.compress(body, 9))):
+        tmp = target.with_name(target.name + '.tmp')
+        tmp.write_bytes(payload)
+        os.replace(tmp, target)
+
+
+def render_page(tab):
+    """HTML halaman snapshot ``tab``."""
+    figs, lines = tabs.get_module(tab).content()
+    charts = '\n'.join(pio.to_html(fig, full_html=False, include_plotlyjs=False, div_id=f'chart-{i}',
+                                   config={'displaylogo': False})
+                       for i, fig in enumerate(figs))
+    nav = ''.join(f'<a href="{page_name(t)}"{_ACTIVE if t == tab else ""}>{html.escape(t)}</a>'
+                  for t in tabs.TABS)
+    insights = '<h4>Insights:</h4>\n' + '\n'.join(_markdown(line) for line in lines) if lines else ''
+    return _PAGE.format(title=html.escape(tab), plotly_js=PLOTLY_JS, css=_CSS, nav=nav, charts=charts,
+                        insights=insights, generated=time.strftime('%Y-%m-%d %H:%M'))
+
+
+def _render(job):
+    tab, out_dir = job
+    start = time.perf_counter()
+    _write(Path(out_dir) / page_name(tab), render_page(tab))
+    return tab, time.perf_counter() - start
+
+
+def _read_manifest(out_dir):
+    try:
+        manifest = json.loads((out_dir / MANIFEST_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+    return manifest.get('tabs', {}) if manifest.get('format') == FORMAT else {}
+
+
+def export(out_dir=None, workers=None, force=False):
+    """Tulis snapshot ke ``out_dir``; mengembalikan (dirender: [(tab, detik)], dilewati: [tab])."""
+    out_dir = Path(out_dir or SNAPSHOT_DIR)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if not (out_dir / PLOTLY_JS).exists():
+        _write(out_dir / PLOTLY_JS, plotly.offline.get_plotlyjs())
+
+    previous = _read_manifest(out_dir)
+    current = {tab: fingerprint(tab) for tab in tabs.TABS if hasattr(tabs.get_module(tab), 'content')}
+    todo = [tab for tab, fp in current.items()
+            if force or previous.get(tab) != fp or not (out_dir / page_name(tab)).exists()]
+    # Modul tab sudah di-import di proses induk, worker mewarisinya
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        rendered = list(pool.map(_render, [(tab, out_dir) for tab in todo]))
+
+    first = next(iter(current), None)
+    if first is not None:
+        _write(out_dir / 'index.html', f'<!DOCTYPE html><meta charset="utf-8">'
+                                       f'<meta http-equiv="refresh" content="0; url={page_name(first)}">')
+    manifest = {'format': FORMAT, 'tabs': current}
+    (out_dir / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+    return rendered, [tab for tab in current if tab not in todo]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m dashboard.snapshot', description=__doc__.splitlines()[0])
+    parser.add_argument('--out', default=None, help=f'direktori bundle (default: {SNAPSHOT_DIR})')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='jumlah proses (default: jumlah CPU)')
+    parser.add_argument('--force', action='store_true', help='render ulang semua tab')
+    args = parser.parse_args(argv)
+
+    rendered, skipped = export(args.out, args.jobs, args.force)
+    for tab, seconds in rendered:
+        print(f'{tab}: {seconds:.1f} detik')
+    if skipped:
+        print(f"tidak berubah: {', '.join(skipped)}")
+    print(f'-> {Path(args.out or SNAPSHOT_DIR)}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
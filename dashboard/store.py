@@ -0,0 +1,183 @@
+"""Penyimpanan indikator kolumnar (Parquet, dipartisi per ``Tahun``).
+
+Setiap indikator disimpan di ``store/<nama>/Tahun=<tahun>/*.parquet`` bersama
+``_meta.json`` yang mencatat versi file sumber. Dataset lain boleh memakai
+kolom partisi berbeda (cube regional dipartisi per ``Provinsi``). Pembacaan
+memakai memory map dan hanya mengambil kolom serta partisi yang diminta.
+"""
+import importlib.util
+import json
+import os
+import shutil
+from pathlib import Path
+
+STORE_DIR = Path(os.environ.get('DASHBOARD_STORE', Path(__file__).resolve().parent.parent / 'store'))
+META_FILE = '_meta.json'
+PARTITION = 'Tahun'
+# Naikkan kalau layout store berubah; dataset format lama dianggap basi
+FORMAT = 2
+
+
+def _dataset_dir(name, store_dir=None):
+    return Path(store_dir or STORE_DIR) / name
+
+
+def meta_path(name, store_dir=None):
+    return _dataset_dir(name, store_dir) / META_FILE
+
+
+def read_meta(name, store_dir=None):
+    path = meta_path(name, store_dir)
+    if not path.exists():
+        return None
+    meta = json.loads(path.read_text())
+    return meta if meta.get('format') == FORMAT else None
+
+
+def stored_version(name, store_dir=None):
+    """Versi sumber dataset ``name`` di store, None kalau belum ada atau tidak bisa dibaca."""
+    if importlib.util.find_spec('pyarrow') is None:
+        return None
+    meta = read_meta(name, store_dir)
+    return None if meta is None else meta['version']
+
+
+def has(name, version, store_dir=None):
+    """True kalau store berisi ``name`` yang dibangun dari sumber versi ``version``."""
+    return version is not None and stored_version(name, store_dir) == version
+
+
+def _partitioning(meta):
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    if not meta['partition']:
+        return None
+    fields = [(col, pa.type_for_alias(t)) for col, t in zip(meta['partition'], meta['partition_types'])]
+    return ds.partitioning(pa.schema(fields), flavor='hive')
+
+
+def write(name, df, version, store_dir=None, partition=(PARTITION,), extra_meta=None):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    target = _dataset_dir(name, store_dir)
+    tmp = target.with_name(target.name + '.tmp')
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    partition = [col for col in partition if col in df.columns]
+    meta = {
+        'format': FORMAT,
+        'version': version,
+        'columns': list(df.columns),
+        'partition': partition,
+        'partition_types': [str(table.schema.field(col).type) for col in partition],
+        'rows': len(df),
+        **(extra_meta or {}),
+    }
+    if partition:
+        pq.write_to_dataset(table, tmp, partitioning=_partitioning(meta))
+    else:
+        pq.write_table(table, tmp / 'part-0.parquet')
+    (tmp / META_FILE).write_text(json.dumps(meta, indent=2))
+
+    # Ganti dataset lama setelah yang baru lengkap ditulis
+    old = target.with_name(target.name + '.old')
+    shutil.rmtree(old, ignore_errors=True)
+    if target.exists():
+        target.rename(old)
+    tmp.rename(target)
+    shutil.rmtree(old, ignore_errors=True)
+    return meta
+
+
+def _write_meta(target, meta):
+    tmp = target / (META_FILE + '.tmp')
+    tmp.write_text(json.dumps(meta, indent=2))
+    tmp.replace(target / META_FILE)
+
+
+def append(name, df, version, store_dir=None):
+    """Tambah baris ``df`` ke dataset ``name`` dan catat versi sumber ``version``.
+
+    Hanya partisi yang menerima baris baru yang ditulis ulang; partisi lain dan
+    dataset lain tidak disentuh. ``_meta.json`` diganti terakhir, jadi pembaca
+    baru memakai dataset ini setelah semua partisi selesai ditulis.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    meta = read_meta(name, store_dir)
+    if meta is None:
+        raise KeyError(f'{name!r} belum ada di store, jalankan python -m dashboard.ingest')
+    if list(df.columns) != meta['columns']:
+        raise ValueError(f'kolom {list(df.columns)} tidak sama dengan dataset {name!r}: {meta["columns"]}')
+    target = _dataset_dir(name, store_dir)
+    partition = meta['partition']
+    groups = df.groupby(partition, sort=False) if partition else [((), df)]
+    for key, rows in groups:
+        key = key if isinstance(key, tuple) else (key,)
+        rel = '/'.join(f'{col}={value}' for col, value in zip(partition, key)) or '.'
+        part_dir = target / rel
+        files = sorted(part_dir.glob('*.parquet'))
+        tables = [pq.read_table(f).replace_schema_metadata(None) for f in files]
+        schema = tables[0].schema if tables else None
+        tables.append(pa.Table.from_pandas(rows.drop(columns=partition), schema=schema,
+                                           preserve_index=False).replace_schema_metadata(None))
+        # Partisi baru ditulis di direktori berawalan '_' (diabaikan pembaca) lalu ditukar
+        tmp = target / ('_tmp_' + rel.replace('/', '_'))
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        pq.write_table(pa.concat_tables(tables), tmp / 'part-0.parquet')
+        if partition:
+            old = target / ('_old_' + rel.replace('/', '_'))
+            shutil.rmtree(old, ignore_errors=True)
+            if part_dir.exists():
+                part_dir.rename(old)
+            part_dir.parent.mkdir(parents=True, exist_ok=True)
+            tmp.rename(part_dir)
+            shutil.rmtree(old, ignore_errors=True)
+        else:
+            for f in files:
+                f.unlink()
+            (tmp / 'part-0.parquet').rename(target / 'part-0.parquet')
+            tmp.rmdir()
+    meta = {**meta, 'version': version, 'rows': meta['rows'] + len(df)}
+    _write_meta(target, meta)
+    return meta
+
+
+def read(name, columns=None, years=None, where=None, store_dir=None):
+    """Baca ``name`` dari store.
+
+    ``columns`` membatasi kolom, ``years`` membatasi ``Tahun`` dan ``where``
+    (``{kolom: [nilai, ...]}``) menyaring kolom lain, biasanya kolom partisi,
+    sehingga partisi di luar filter tidak dibaca sama sekali.
+    """
+    import pyarrow.parquet as pq
+
+    meta = read_meta(name, store_dir)
+    if meta is None:
+        raise KeyError(f'{name!r} belum ada di store, jalankan python -m dashboard.ingest')
+    filters = [(col, 'in', list(values)) for col, values in (where or {}).items()]
+    if years is not None:
+        filters.append((PARTITION, 'in', [int(y) for y in years]))
+    read_columns = list(columns) if columns is not None else None
+    if read_columns is not None:
+        # Kolom partisi tetap dibaca untuk mengurutkan baris, lalu dibuang
+        read_columns += [col for col in meta['partition'] if col not in read_columns]
+    table = pq.read_table(
+        _dataset_dir(name, store_dir),
+        columns=read_columns,
+        filters=filters or None,
+        memory_map=True,
+        partitioning=_partitioning(meta),
+    )
+    # split_blocks: kolom tidak digabung ke blok 2D, jadi tidak ada copy tambahan
+    df = table.to_pandas(split_blocks=True)
+    if meta['partition']:
+        df = df.sort_values(meta['partition'], kind='stable', ignore_index=True)
+    wanted = list(columns) if columns is not None else meta['columns']
+    return df[[c for c in wanted if c in df.columns]]
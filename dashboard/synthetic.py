@@ -0,0 +1,206 @@
+"""Data sintetis deterministik untuk tab placeholder dan uji skala.
+
+Seri bulanan dibangkitkan dari seed tetap: tren, musiman dan noise AR(1).
+Hasilnya sama di setiap proses dan tidak berubah di setiap rerun. Keluarannya
+memakai format indikator asli. File sumber nasional ditulis ke
+``data/synthetic/<nama>.csv`` (env ``DASHBOARD_SYNTHETIC_DIR``) dan terdaftar
+di ``data.INDICATORS``. Untuk uji skala, cube per kabupaten/kota ditulis ke
+store yang sama dengan indikator asli. Argumen default menghasilkan ulang
+file bawaan byte demi byte.
+
+Contoh::
+
+    python -m dashboard.synthetic                                    # file sumber bawaan
+    export DASHBOARD_SYNTHETIC_DIR=/tmp/skala/sumber DASHBOARD_STORE=/tmp/skala/store
+    python -m dashboard.synthetic --years 1960-2024 --regencies 3000
+"""
+import argparse
+import hashlib
+import json
+import sys
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from dashboard import cube, data, ingest, store
+
+SEED = 42
+YEARS = (2010, 2024)
+# Naikkan kalau model berubah supaya versi cube sintetis ikut berubah
+MODEL_VERSION = 1
+# Koefisien AR(1) noise bulanan
+PHI = 0.8
+MAX_REGENCIES_PER_PROVINCE = 99
+
+# level: nilai bulan pertama; growth: per tahun (aditif: log, rasio: poin);
+# season: amplitudo musiman; noise: simpangan shock AR(1); additive: boleh dijumlahkan antarwilayah
+Measure = namedtuple('Measure', ['level', 'growth', 'season', 'noise', 'additive'])
+
+SPECS = {
+    'inflasi': {'Inflasi': Measure(3.5, 0.0, 0.4, 0.35, False)},
+    'ekspor_impor': {'Ekspor': Measure(15000.0, 0.04, 0.05, 0.04, True),
+                     'Impor': Measure(13500.0, 0.035, 0.04, 0.04, True)},
+    'apbn': {'Belanja_Pegawai': Measure(25.0, 0.05, 0.15, 0.03, True)},
+    'ketenagakerjaan': {'TPT': Measure(6.0, -0.05, 0.2, 0.15, False)},
+}
+
+
+def _rng(seed, *parts):
+    # Stream per (indikator, kolom, ...) supaya menambah kolom tidak menggeser seri lain
+    digest = hashlib.sha1('/'.join(parts).encode()).hexdigest()
+    return np.random.default_rng([seed, int(digest[:8], 16)])
+
+
+def _ar1(rng, n_series, n_periods, scale):
+    shocks = rng.normal(0.0, scale, size=(n_series, n_periods))
+    out = np.empty_like(shocks)
+    out[:, 0] = shocks[:, 0] / np.sqrt(1 - PHI ** 2)
+    # Rekursi di sumbu waktu, vektorisasi di sumbu wilayah
+    for t in range(1, n_periods):
+        out[:, t] = PHI * out[:, t - 1] + shocks[:, t]
+    return out
+
+
+def _values(measure, rng, bulan):
+    years = np.arange(len(bulan)) / 12
+    season = measure.season * np.sin(2 * np.pi * (bulan - 1) / 12)
+    shocks = _ar1(rng, 1, len(bulan), measure.noise)
+    if measure.additive:
+        return measure.level * np.exp(measure.growth * years + season + shocks)
+    return np.maximum(measure.level + measure.growth * years + season + shocks, 0.0)
+
+
+def _calendar(years):
+    first, last = years
+    return np.repeat(np.arange(first, last + 1), 12), np.tile(np.arange(1, 13), last - first + 1)
+
+
+def generate(name, years=YEARS, seed=SEED):
+    """Tabel sumber nasional ``name`` (``Tahun``, ``Bulan``, ukuran) untuk tahun ``years`` (awal, akhir)."""
+    tahun, bulan = _calendar(years)
+    df = pd.DataFrame({'Tahun': tahun, 'Bulan': bulan})
+    for column, measure in SPECS[name].items():
+        df[column] = np.round(_values(measure, _rng(seed, name, column), bulan)[0], 2)
+    return df
+
+
+def regencies(count):
+    """Kode dan nama ``count`` kabupaten/kota sintetis, dibagi rata ke provinsi di ``wilayah.csv``."""
+    provinces = pd.read_csv(cube.WILAYAH_FILE, dtype=str)['Kode_Wilayah']
+    provinces = provinces[provinces != data.NATIONAL].to_numpy()
+    if count > MAX_REGENCIES_PER_PROVINCE * len(provinces):
+        raise ValueError(f'maksimal {MAX_REGENCIES_PER_PROVINCE * len(provinces)} kabupaten/kota')
+    per_province = np.full(len(provinces), count // len(provinces))
+    per_province[:count % len(provinces)] += 1
+    codes = [f'{p}{i:02d}' for p, n in zip(provinces, per_province) for i in range(1, n + 1)]
+    return pd.DataFrame({'Kode_Wilayah': codes, 'Nama_Wilayah': [f'Kab. Sintetis {c}' for c in codes]})
+
+
+def _long(codes, tahun, bulan, columns):
+    n = len(tahun)
+    df = pd.DataFrame({'Kode_Wilayah': np.repeat(codes, n), 'Tahun': np.tile(tahun, len(codes)),
+                       'Bulan': np.tile(bulan, len(codes))})
+    for column, values in columns.items():
+        df[column] = np.round(values.ravel(), 2)
+    return df
+
+
+def generate_regional(name, count, years=YEARS, seed=SEED):
+    """Tabel regional ``name`` dengan ``count`` kabupaten/kota, format input ``cube.build``.
+
+    Ukuran aditif hanya ada di level kabupaten/kota (provinsi dan nasional
+    dijumlahkan oleh cube); rasio dirilis di semua level.
+    """
+    tahun, bulan = _calendar(years)
+    national = generate(name, years, seed)
+    wilayah = regencies(count)
+    codes = wilayah['Kode_Wilayah'].to_numpy()
+    provinces, province_of = np.unique(wilayah['Kode_Wilayah'].str[:2], return_inverse=True)
+
+    regency_cols, province_cols, national_cols = {}, {}, {}
+    for column, measure in SPECS[name].items():
+        rng = _rng(seed, name, column, 'wilayah')
+        base = national[column].to_numpy()
+        # Noise wilayah lebih kecil dari noise nasional supaya rollup tetap halus
+        shocks = _ar1(rng, len(codes), len(bulan), measure.noise / 2)
+        if measure.additive:
+            shares = rng.dirichlet(np.full(len(codes), 2.0))[:, None]
+            regency_cols[column] = base * shares * np.exp(shocks)
+            continue
+        province_offset = rng.normal(0.0, measure.level * 0.2, size=len(provinces))
+        regency_offset = province_offset[province_of] + rng.normal(0.0, measure.level * 0.1, size=len(codes))
+        regency_cols[column] = np.maximum(base + regency_offset[:, None] + shocks, 0.0)
+        province_cols[column] = np.maximum(base + province_offset[:, None], 0.0)
+        national_cols[column] = base[None, :]
+
+    frames = [_long(codes, tahun, bulan, regency_cols).merge(wilayah, on='Kode_Wilayah')]
+    if province_cols:
+        frames.append(_long(provinces, tahun, bulan, province_cols))
+        frames.append(_long([data.NATIONAL], tahun, bulan, national_cols))
+    return pd.concat(frames, ignore_index=True)
+
+
+def version(name, years=YEARS, count=0, seed=SEED):
+    params = {'name': name, 'years': list(years), 'regencies': count, 'seed': seed, 'model': MODEL_VERSION}
+    return hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+def write_source(name, years=YEARS, seed=SEED):
+    """Tulis file sumber nasional ``name`` (path di ``data.INDICATORS``)."""
+    (path,), _ = data.INDICATORS[name]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df = generate(name, years, seed)
+    df.to_csv(path, index=False)
+    return df
+
+
+def write_cube(name, count, years=YEARS, seed=SEED, store_dir=None):
+    """Bangun dan tulis cube regional sintetis ``name`` ke store."""
+    measures = {column: measure.additive for column, measure in SPECS[name].items()}
+    df, names = cube.build(name, generate_regional(name, count, years, seed), measures)
+    return store.write(data.cube_name(name), df, version(name, years, count, seed), store_dir,
+                       partition=('Provinsi',), extra_meta={'regions': names})
+
+
+def _years(value):
+    first, _, last = value.partition('-')
+    try:
+        years = (int(first), int(last or first))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'format TAHUN-TAHUN: {value!r}') from None
+    if years[0] > years[1]:
+        raise argparse.ArgumentTypeError(f'tahun awal setelah tahun akhir: {value!r}')
+    return years
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m dashboard.synthetic', description=__doc__.splitlines()[0])
+    parser.add_argument('names', nargs='*', help='indikator sintetis (default: semua)')
+    parser.add_argument('--years', type=_years, default=YEARS, help='rentang tahun, mis. 1960-2024')
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--regencies', type=int, default=0, help='jumlah kabupaten/kota untuk cube regional')
+    parser.add_argument('--store', default=None, help=f'direktori store (default: {store.STORE_DIR})')
+    parser.add_argument('--no-store', action='store_true', help='hanya tulis file sumber')
+    args = parser.parse_args(argv)
+
+    unknown = [n for n in args.names if n not in SPECS]
+    if unknown:
+        parser.error(f"indikator sintetis tidak dikenal: {', '.join(unknown)}")
+    for name in args.names or SPECS:
+        df = write_source(name, args.years, args.seed)
+        line = f'{name}: {len(df)} baris'
+        if not args.no_store:
+            ingest.ingest(name, args.store)
+        if args.regencies and not args.no_store:
+            try:
+                meta = write_cube(name, args.regencies, args.years, args.seed, args.store)
+            except ValueError as exc:
+                parser.error(str(exc))
+            line += f", cube {meta['rows']} baris"
+        print(line)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""Router tab: setiap tab adalah modul sendiri dengan fungsi ``render()``.
+
+Modul tab baru di-import saat tab itu pertama kali dibuka, jadi import dan
+data prep tab lain tidak ikut jalan di rerun.
+"""
+import importlib
+
+# Urutan sama dengan menu utama
+TABS = {
+    'Neraca Nasional': 'neraca_nasional',
+    'Indeks Harga': 'indeks_harga',
+    'Ekspor-Impor': 'ekspor_impor',
+    'APBN': 'apbn',
+    'Ketenagakerjaan': 'ketenagakerjaan',
+    'Kemiskinan': 'kemiskinan',
+    'IPM': 'ipm',
+    'Perbandingan': 'perbandingan',
+}
+
+# Indikator yang dipakai setiap tab berdata (untuk invalidasi dan prebuild)
+TAB_INDICATORS = {
+    'Neraca Nasional': ('pdb',),
+    'Indeks Harga': ('inflasi',),
+    'Ekspor-Impor': ('ekspor_impor',),
+    'APBN': ('apbn',),
+    'Ketenagakerjaan': ('ketenagakerjaan',),
+    'Kemiskinan': ('kemiskinan',),
+    'IPM': ('ipm',),
+    'Perbandingan': ('pdb', 'kemiskinan', 'ipm'),
+}
+
+
+def tabs_using(name):
+    return [tab for tab, names in TAB_INDICATORS.items() if name in names]
+
+
+def get_module(tab):
+    return importlib.import_module(f'{__name__}.{TABS[tab]}')
+
+
+def render(tab):
+    get_module(tab).render()
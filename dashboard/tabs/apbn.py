@@ -0,0 +1,46 @@
+import plotly.express as px
+import streamlit as st
+
+from dashboard import charts, data, export, figures, regions
+
+
+def build_figure(height=320, region=data.NATIONAL):
+    df = data.load('apbn', columns=['Tahun', 'Belanja_Pegawai'], region=region)
+    # Realisasi bulanan dijumlahkan per tahun anggaran
+    sample_data = df.groupby('Tahun', as_index=False)['Belanja_Pegawai'].sum()
+    label = '' if region == data.NATIONAL else f" {regions.label('apbn', region)}"
+    title = f"Belanja Pegawai{label} (data sintetis)"
+
+    fig_sample = px.line(sample_data, x='Tahun', y='Belanja_Pegawai', title=title, markers=True)
+    fig_sample.update_traces(line=dict(color='teal', width=2), marker=dict(size=5, color='teal'),
+                             hovertemplate='<b>%{x}</b><br>Belanja Pegawai: %{y:,.1f}T Rp<extra></extra>')
+    fig_sample.update_layout(height=height, plot_bgcolor='white', margin=dict(l=30, r=30, t=40, b=30),
+                             yaxis_title='Triliun Rp')
+    fig_sample.update_xaxes(type='category')
+    return fig_sample
+
+
+def figure(region=data.NATIONAL):
+    return figures.get_figure('APBN', 'belanja_pegawai', data.data_version('apbn', region),
+                              build_figure, height=320, region=region)
+
+
+def content(region=data.NATIONAL):
+    """Figure dan bullet insight tab ini (dipakai ``dashboard.prebuild`` dan ``dashboard.snapshot``)."""
+    return [figure(region)], []
+
+
+def render():
+    chart_col, insight_col = st.columns([2.5, 1])
+
+    with chart_col:
+        region = regions.picker('apbn', key='apbn_wilayah')
+        fig_sample = figure(region)
+        charts.plotly_chart(fig_sample)
+        export.indicator_buttons('apbn', region)
+        
+    with insight_col:
+        st.markdown('<div class="insight-section">', unsafe_allow_html=True)
+        st.markdown("#### Insight:")
+        st.markdown("• ....")
+        st.markdown('</div>', unsafe_allow_html=True)
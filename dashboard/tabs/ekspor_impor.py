@@ -0,0 +1,106 @@
+from functools import partial
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from dashboard import charts, data, export, figures, regions
+
+# Jumlah tahun terakhir yang ditampilkan
+YEARS_SHOWN = 4
+
+
+def table(region=data.NATIONAL):
+    """Tabel yang di-plot: total tahunan ekspor/impor dan kontribusinya (juga untuk tombol unduh)."""
+    df = data.load('ekspor_impor', columns=['Tahun', 'Ekspor', 'Impor'], region=region)
+
+    # Nilai bulanan dijumlahkan per tahun, hanya beberapa tahun terakhir
+    yearly = df.groupby('Tahun', as_index=False)[['Ekspor', 'Impor']].sum().tail(YEARS_SHOWN)
+
+    # Hitung kontribusi terhadap total perdagangan
+    yearly['Total'] = yearly['Ekspor'] + yearly['Impor']
+    yearly['Ekspor_Kontribusi'] = (yearly['Ekspor'] / yearly['Total']) * 100
+    yearly['Impor_Kontribusi'] = (yearly['Impor'] / yearly['Total']) * 100
+    return yearly.reset_index(drop=True)
+
+
+def build_figure(height=320, region=data.NATIONAL):
+    sample_data = table(region)
+    sample_data['Tahun'] = sample_data['Tahun'].astype(str)
+    
+    title = "Kontribusi Ekspor dan Impor Migas & Non Migas" + (f" {regions.label('ekspor_impor', region)}"
+                                                              if region != data.NATIONAL else '')
+    
+    # Membuat bar chart
+    fig_sample = go.Figure()
+    
+    # Bar Ekspor
+    fig_sample.add_trace(go.Bar(
+        x=sample_data['Tahun'], 
+        y=sample_data['Ekspor'],
+        name='Ekspor',
+        marker_color='teal',
+        text=sample_data['Ekspor_Kontribusi'].apply(lambda x: f'{x:.1f}%'),
+        textposition='outside',
+        textfont=dict(size=10, color='teal'),
+        hovertemplate='<b>%{x}</b><br>Nilai: %{y:,.0f} Juta USD<extra></extra>'
+    ))
+    
+    # Bar Impor
+    fig_sample.add_trace(go.Bar(
+        x=sample_data['Tahun'], 
+        y=sample_data['Impor'],
+        name='Impor',
+        marker_color='orange',
+        text=sample_data['Impor_Kontribusi'].apply(lambda x: f'{x:.1f}%'),
+        textposition='outside',
+        textfont=dict(size=10, color='orange'),
+        hovertemplate='<b>%{x}</b><br>Nilai: %{y:,.0f} Juta USD<extra></extra>'
+    ))
+    
+    fig_sample.update_layout(
+        title=title,
+        height=height, 
+        plot_bgcolor='white', 
+        margin=dict(l=30, r=30, t=50, b=30),
+        xaxis_title="Tahun",
+        yaxis_title="Nilai (Juta USD)",
+        barmode='group',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+
+    return fig_sample
+
+
+def figure(region=data.NATIONAL):
+    return figures.get_figure('Ekspor-Impor', 'kontribusi', data.data_version('ekspor_impor', region),
+                              build_figure, height=320, region=region)
+
+
+def content(region=data.NATIONAL):
+    """Figure dan bullet insight tab ini (dipakai ``dashboard.prebuild`` dan ``dashboard.snapshot``)."""
+    return [figure(region)], []
+
+
+def render():
+    chart_col, insight_col = st.columns([2.5, 1])
+
+    with chart_col:
+        region = regions.picker('ekspor_impor', key='ekspor_impor_wilayah')
+        fig_sample = figure(region)
+        charts.plotly_chart(fig_sample)
+        # Tabel tahunan yang di-plot, bukan baris bulanan sumbernya; paling banyak YEARS_SHOWN baris
+        stem = 'ekspor_impor_tahunan' if region == data.NATIONAL else f'ekspor_impor_tahunan_{region}'
+        export.buttons(stem, (stem, data.data_version('ekspor_impor', region), YEARS_SHOWN),
+                       partial(table, region), 'export_ekspor_impor', YEARS_SHOWN)
+        
+    with insight_col:
+        st.markdown('<div class="insight-section">', unsafe_allow_html=True)
+        st.markdown("#### Insight:")
+        st.markdown("•.....")
+        st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,42 @@
+import plotly.express as px
+import streamlit as st
+
+from dashboard import charts, data, export, figures, regions
+
+
+def build_figure(height=320, region=data.NATIONAL):
+    df = data.load('inflasi', columns=['Period', 'Date', 'Inflasi'], region=region)
+    title = "Inflasi " + (regions.label('inflasi', region) or 'Indonesia') + " (y-o-y, data sintetis)"
+
+    fig_sample = px.line(df, x='Date', y='Inflasi', title=title, markers=True)
+    fig_sample.update_traces(line=dict(color='teal', width=2), marker=dict(size=5, color='teal'),
+                             hovertemplate='<b>%{x|%Y %b}</b><br>Inflasi: %{y:.2f}%<extra></extra>')
+    fig_sample.update_layout(height=height, plot_bgcolor='white', margin=dict(l=30, r=30, t=40, b=30),
+                             xaxis_title='Periode', yaxis_title='Inflasi (%)')
+    return fig_sample
+
+
+def figure(region=data.NATIONAL):
+    return figures.get_figure('Indeks Harga', 'inflasi', data.data_version('inflasi', region),
+                              build_figure, height=320, region=region)
+
+
+def content(region=data.NATIONAL):
+    """Figure dan bullet insight tab ini (dipakai ``dashboard.prebuild`` dan ``dashboard.snapshot``)."""
+    return [figure(region)], []
+
+
+def render():
+    chart_col, insight_col = st.columns([2.5, 1])
+
+    with chart_col:
+        region = regions.picker('inflasi', key='inflasi_wilayah')
+        fig_sample = figure(region)
+        charts.plotly_chart(fig_sample)
+        export.indicator_buttons('inflasi', region)
+        
+    with insight_col:
+        st.markdown('<div class="insight-section">', unsafe_allow_html=True)
+        st.markdown("#### Insight:")
+        st.markdown("• ....")
+        st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,132 @@
+import plotly.graph_objects as go
+import streamlit as st
+
+from dashboard import charts, data, export, figures, insights, regions
+
+
+def build_figure(height=350, region=data.NATIONAL):
+    df_ipm = data.load('ipm', region=region)
+    fig_ipm = go.Figure()
+
+    # Gender Gap - filled area between lines
+    fig_ipm.add_trace(go.Scatter(
+        x=df_ipm['Tahun'].tolist() + df_ipm['Tahun'].tolist()[::-1],
+        y=df_ipm['IPM_Laki_laki'].tolist() + df_ipm['IPM_Perempuan'].tolist()[::-1],
+        fill='toself',
+        fillcolor='rgba(255,0,0,0.2)',
+        line=dict(color='rgba(255,255,255,0)'),
+        name='Gender Gap',
+        hoverinfo='skip',
+        showlegend=True,
+        legendrank=1 
+    ))
+
+    # IPM Laki-laki line
+    fig_ipm.add_trace(go.Scatter(
+        x=df_ipm['Tahun'],
+        y=df_ipm['IPM_Laki_laki'],
+        name='IPM Laki-laki',
+        line=dict(color='#1f77b4', width=3),
+        marker=dict(size=8, color='#1f77b4'),
+        hovertemplate='<b>%{x}</b><br>IPM Laki-laki: %{y:.2f}<extra></extra>'
+    ))
+
+    # IPM Perempuan line
+    fig_ipm.add_trace(go.Scatter(
+        x=df_ipm['Tahun'],
+        y=df_ipm['IPM_Perempuan'],
+        name='IPM Perempuan',
+        line=dict(color='#ff7f0e', width=3),
+        marker=dict(size=8, color='#ff7f0e'),
+        hovertemplate='<b>%{x}</b><br>IPM Perempuan: %{y:.2f}<extra></extra>'
+    ))
+
+    # Add trend line for total IPM
+    fig_ipm.add_trace(go.Scatter(
+        x=df_ipm['Tahun'],
+        y=df_ipm['IPM_Total'],
+        name='IPM Rata-rata',
+        line=dict(color='green', width=2, dash='dot'),
+        marker=dict(size=6, color='green'),
+        # Gender gap ikut di hover garis rata-rata (titik tengahnya sama), tanpa trace tak terlihat
+        customdata=df_ipm['Gender_Gap'],
+        hovertemplate='<b>%{x}</b><br>IPM Rata-rata: %{y:.2f}<br>Gender Gap: %{customdata:.2f} poin<extra></extra>'
+    ))
+
+    fig_ipm.update_layout(
+        title='Indeks Pembangunan Manusia ' + (regions.label('ipm', region) or 'Indonesia'),
+        height=height,
+        plot_bgcolor='white',
+        hovermode='x unified',
+        yaxis=dict(
+            title='Skor IPM',
+            side='left',
+            showgrid=True,
+            gridcolor='lightgray',
+            range=[68, 80] if region == data.NATIONAL else None
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=0.95,
+            xanchor="right",
+            x=1,
+            font=dict(size=10)
+        ),
+        margin=dict(l=50, r=50, t=60, b=40)
+    )
+
+    # Update x-axis
+    fig_ipm.update_xaxes(
+        title='Tahun',
+        showgrid=True,
+        gridcolor='lightgray',
+        dtick=1
+    )
+
+    return fig_ipm
+
+
+def insight_lines(region=data.NATIONAL):
+    """Bullet insight IPM (ringkasan di-cache per versi data)."""
+    total = insights.summary('ipm', 'IPM_Total', label='Tahun', region=region)
+    gap = insights.summary('ipm', 'Gender_Gap', label='Tahun', region=region, higher_is_better=False)
+    male = insights.summary('ipm', 'IPM_Laki_laki', label='Tahun', region=region)
+    female = insights.summary('ipm', 'IPM_Perempuan', label='Tahun', region=region)
+    if total.previous is None:
+        return []
+    trend = 'menyempit' if gap.latest.value < gap.first.value else 'melebar'
+    return [
+        f"• **IPM Rata-rata**: {total.latest.value:.2f} ({total.latest.label}), "
+        f"{total.delta:+.2f} poin dari {total.previous.label}",
+        f"• **Gender Gap**: {trend} {gap.first.value:.2f}→{gap.latest.value:.2f} poin "
+        f"({gap.first.label}–{gap.latest.label})",
+        f"• **Laju**: Perempuan {female.slope:+.2f}/tahun vs laki-laki {male.slope:+.2f}/tahun",
+    ]
+
+
+def figure(region=data.NATIONAL):
+    return figures.get_figure('IPM', 'gender_gap', data.data_version('ipm', region),
+                              build_figure, height=350, region=region)
+
+
+def content(region=data.NATIONAL):
+    """Figure dan bullet insight tab ini (dipakai ``dashboard.prebuild`` dan ``dashboard.snapshot``)."""
+    return [figure(region)], insight_lines(region)
+
+
+def render():
+    chart_col, insight_col = st.columns([2.5, 1])
+    
+    with chart_col:
+        region = regions.picker('ipm', key='ipm_wilayah')
+        # Create single chart
+        fig_ipm = figure(region)
+        charts.plotly_chart(fig_ipm)
+        export.indicator_buttons('ipm', region)
+        
+    with insight_col:
+        st.markdown('<div class="insight-section">', unsafe_allow_html=True)
+        st.markdown("#### Insights:")
+        for line in insight_lines(region):
+            st.markdown(line)
@@ -0,0 +1,213 @@
+import plotly.graph_objects as go
+import streamlit as st
+
+from dashboard import charts, data, downsample, export, figures, insights, instrumentation, metrics, regions
+
+
+BUDGET = downsample.point_budget(width_px=550)
+# Pilihan seri di filter -> chart
+CHARTS = {'Persentase Miskin': 'kemiskinan', 'Gini Ratio': 'gini'}
+# Chart -> kolom tabel kemiskinan, untuk tombol unduh
+COLUMNS = {'kemiskinan': 'Persentase_Miskin', 'gini': 'Gini_Ratio'}
+
+
+def build_poverty_figure(height=300, budget=BUDGET, zoom=None, region=data.NATIONAL, span=None):
+    df_kemiskinan = data.load('kemiskinan', columns=['Period', 'Date', 'Persentase_Miskin'], region=region)
+    national = region == data.NATIONAL
+    # Rentang periode dulu (binary search di Date), lalu zoom box-select di dalamnya
+    df_kemiskinan = downsample.window(df_kemiskinan, span, 'Date')
+    df_kemiskinan = downsample.downsample(downsample.window(df_kemiskinan, zoom, 'Date'),
+                                          'Persentase_Miskin', budget, x='Date')
+    fig1 = go.Figure()
+
+    # Line untuk persentase kemiskinan
+    fig1.add_trace(go.Scatter(
+        x=df_kemiskinan['Date'],
+        y=df_kemiskinan['Persentase_Miskin'],
+        line=dict(color='red', width=3),
+        marker=dict(size=6, color='red'),
+        yaxis='y2',
+        # Label periode dari tanggal (Mar/Sep), tanpa array text terpisah
+        hovertemplate='<b>%{x|%Y %b}</b><br>Persentase: %{y:.2f}%<extra></extra>'
+    ))
+
+    # Add shaded areas untuk periode khusus
+    fig1.add_vrect(
+        x0="2020-01-01", x1="2021-12-31",
+        fillcolor="red", opacity=0.1,
+        line_width=0,
+    )
+
+    fig1.update_layout(
+        title=f"Kemiskinan {regions.label('kemiskinan', region) or 'Indonesia'}: Jumlah vs Persentase (2011-2024)",
+        height=height,
+        plot_bgcolor='white',
+        hovermode='x unified',
+        yaxis=dict(
+            title='Jumlah Penduduk Miskin (Juta)',
+            side='left',
+            showgrid=True,
+            gridcolor='lightgray',
+            range=[20, 32] if national else None
+        ),
+        yaxis2=dict(
+            title='Persentase (%)',
+            side='right',
+            overlaying='y',
+            showgrid=False,
+            range=[8, 14] if national else None
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            font=dict(size=9)
+        ),
+        margin=dict(l=40, r=40, t=50, b=30)
+    )
+
+    fig1.update_xaxes(
+        tickangle=45,
+        tickmode='array',
+        tickvals=df_kemiskinan['Date'][::4],  # Show every 4th label
+        ticktext=[x.split()[0] + ' ' + x.split()[1][:3] for x in df_kemiskinan['Period'][::4]]
+    )
+
+    return fig1
+
+
+def build_gini_figure(height=280, budget=BUDGET, zoom=None, region=data.NATIONAL, span=None):
+    df_kemiskinan = data.load('kemiskinan', columns=['Period', 'Date', 'Gini_Ratio'], region=region)
+    national = region == data.NATIONAL
+    df_kemiskinan = downsample.window(df_kemiskinan, span, 'Date')
+    df_kemiskinan = downsample.downsample(downsample.window(df_kemiskinan, zoom, 'Date'),
+                                          'Gini_Ratio', budget, x='Date')
+    fig2 = go.Figure()
+
+    # Color coding untuk Gini Ratio
+    gini_colors = metrics.bucket(df_kemiskinan['Gini_Ratio'], 'gini')
+
+    fig2.add_trace(go.Scatter(
+        x=df_kemiskinan['Date'],
+        y=df_kemiskinan['Gini_Ratio'],
+        mode='lines+markers',
+        name='Gini Ratio',
+        line=dict(color='navy', width=2),
+        marker=dict(size=8, color=gini_colors, line=dict(width=2, color='navy')),
+        hovertemplate='<b>%{x|%Y %b}</b><br>Gini Ratio: %{y:.3f}<extra></extra>'
+    ))
+
+    # Add threshold lines
+    fig2.add_hline(y=0.4, line_dash="dash", line_color="red", line_width=1, 
+                  annotation_text="High Inequality (0.4)", annotation_position="right")
+    fig2.add_hline(y=0.385, line_dash="dot", line_color="orange", line_width=1,
+                  annotation_text="Moderate (0.385)", annotation_position="right")
+
+    fig2.update_layout(
+        title='Indeks Gini: Ketimpangan Distribusi Pendapatan' + ('' if national else f" {regions.label('kemiskinan', region)}"),
+        height=height,
+        plot_bgcolor='white',
+        yaxis=dict(
+            title='Gini Ratio',
+            showgrid=True,
+            gridcolor='lightgray',
+            range=[0.37, 0.42] if national else None
+        ),
+        margin=dict(l=40, r=40, t=50, b=30)
+    )
+
+    fig2.update_xaxes(
+        tickangle=45,
+        tickmode='array',
+        tickvals=df_kemiskinan['Date'][::4],
+        ticktext=[x.split()[0] + ' ' + x.split()[1][:3] for x in df_kemiskinan['Period'][::4]]
+    )
+
+    return fig2
+
+
+def insight_lines(region=data.NATIONAL):
+    """Bullet insight kemiskinan dan Gini (ringkasan di-cache per versi data)."""
+    poverty = insights.summary('kemiskinan', 'Persentase_Miskin', region=region, higher_is_better=False)
+    gini = insights.summary('kemiskinan', 'Gini_Ratio', region=region, higher_is_better=False)
+    lines = []
+    if poverty.latest is not None:
+        episode = poverty.worst_episode()
+        if episode is not None:
+            start, end = episode.start, episode.end
+            lines.append(f"• **{end.label[:4]} Shock**: Naik {start.value:.2f}%→{end.value:.2f}% "
+                         f"({start.label}–{end.label})")
+            if episode.recovered is not None:
+                lines.append(f"• **Recovery**: Kembali ke {episode.recovered.value:.2f}% {episode.recovered.label}, "
+                             f"{episode.recovered.pos - end.pos} semester setelah puncak")
+            else:
+                lines.append(f"• **Recovery**: Belum kembali ke {start.value:.2f}%")
+        if poverty.previous is not None:
+            lines.append(f"• **Latest**: {poverty.latest.value:.2f}% {poverty.latest.label} "
+                         f"({poverty.delta:+.2f} pp), terendah {poverty.low.value:.2f}% {poverty.low.label}")
+    if gini.latest is not None:
+        trend = 'Improvement' if gini.latest.value < gini.first.value else 'Worsening'
+        lines.append(f"• **Gini {trend}**: {gini.first.value:.3f}→{gini.latest.value:.3f} "
+                     f"({gini.first.label}–{gini.latest.label})")
+    return lines
+
+
+def figure(chart, region=data.NATIONAL, zoom=None, span=None):
+    """Figure ``chart`` (nilai ``CHARTS``) untuk wilayah dan filter ini."""
+    version = data.data_version('kemiskinan', region)
+    if chart == 'kemiskinan':
+        # Chart 1: Dual axis - Poverty Rate & Number of Poor
+        return figures.get_figure('Kemiskinan', 'kemiskinan', version, build_poverty_figure, height=300,
+                                  budget=BUDGET, zoom=zoom, region=region, span=span)
+    # Chart 2: Gini Ratio Trend with color coding
+    return figures.get_figure('Kemiskinan', 'gini', version, build_gini_figure, height=280,
+                              budget=BUDGET, zoom=zoom, region=region, span=span)
+
+
+def content(region=data.NATIONAL):
+    """Figure dan bullet insight tab ini (dipakai ``dashboard.prebuild`` dan ``dashboard.snapshot``)."""
+    return [figure(chart, region) for chart in CHARTS.values()], insight_lines(region)
+
+
+@st.fragment
+def chart_section(region):
+    """Filter dan chart; interaksi di sini hanya menjalankan ulang fragment ini."""
+    with instrumentation.fragment('kemiskinan'):
+        df_kemiskinan = data.load('kemiskinan', columns=['Period', 'Date'], region=region)
+        range_col, series_col = st.columns([2, 1])
+        with range_col:
+            span = charts.period_range(df_kemiskinan, key=f'kemiskinan_periode_{region}')
+        with series_col:
+            selected = st.multiselect('Seri', list(CHARTS), default=list(CHARTS), key='kemiskinan_seri')
+
+        # Zoom lewat box-select hanya aktif kalau seri perlu di-downsample
+        n_rows = len(downsample.window(df_kemiskinan, span, 'Date'))
+        zoomable = downsample.needed(n_rows, BUDGET)
+        shown = [CHARTS[name] for name in selected]
+        if not shown:
+            return
+        for col, chart in zip(st.columns(len(shown)), shown):
+            with col:
+                zoom_key = f'{chart}_chart_{region}' if zoomable else None
+                fig = figure(chart, region, zoom=charts.zoom_selection(zoom_key), span=span)
+                charts.plotly_chart(fig, zoom_key=zoom_key)
+        export.indicator_buttons('kemiskinan', region, span, ['Period', 'Date', *(COLUMNS[c] for c in shown)])
+
+
+def render():
+    region = regions.picker('kemiskinan', key='kemiskinan_wilayah')
+
+    # Create two charts side by side
+    chart_col, insight_col = st.columns([2.6, 1])
+
+    with chart_col:
+        chart_section(region)
+    
+    with insight_col:
+        st.markdown('<div class="insight-section">', unsafe_allow_html=True)
+        st.markdown("#### Insights:")
+        for line in insight_lines(region):
+            st.markdown(line)
+        st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,43 @@
+import plotly.express as px
+import streamlit as st
+
+from dashboard import charts, data, export, figures, regions
+
+
+def build_figure(height=320, region=data.NATIONAL):
+    df = data.load('ketenagakerjaan', columns=['Period', 'Date', 'TPT'], region=region)
+    label = '' if region == data.NATIONAL else f" {regions.label('ketenagakerjaan', region)}"
+    title = f"Tingkat Pengangguran Terbuka{label} (data sintetis)"
+
+    fig_sample = px.line(df, x='Date', y='TPT', title=title, markers=True)
+    fig_sample.update_traces(line=dict(color='teal', width=2), marker=dict(size=5, color='teal'),
+                             hovertemplate='<b>%{x|%Y %b}</b><br>TPT: %{y:.2f}%<extra></extra>')
+    fig_sample.update_layout(height=height, plot_bgcolor='white', margin=dict(l=30, r=30, t=40, b=30),
+                             xaxis_title='Periode', yaxis_title='TPT (%)')
+    return fig_sample
+
+
+def figure(region=data.NATIONAL):
+    return figures.get_figure('Ketenagakerjaan', 'tpt', data.data_version('ketenagakerjaan', region),
+                              build_figure, height=320, region=region)
+
+
+def content(region=data.NATIONAL):
+    """Figure dan bullet insight tab ini (dipakai ``dashboard.prebuild`` dan ``dashboard.snapshot``)."""
+    return [figure(region)], []
+
+
+def render():
+    chart_col, insight_col = st.columns([2.5, 1])
+
+    with chart_col:
+        region = regions.picker('ketenagakerjaan', key='ketenagakerjaan_wilayah')
+        fig_sample = figure(region)
+        charts.plotly_chart(fig_sample)
+        export.indicator_buttons('ketenagakerjaan', region)
+        
+    with insight_col:
+        st.markdown('<div class="insight-section">', unsafe_allow_html=True)
+        st.markdown("#### Insight:")
+        st.markdown("• .....")
+        st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,197 @@
+import plotly.graph_objects as go
+import streamlit as st
+
+from dashboard import charts, data, downsample, export, figures, insights, instrumentation, metrics, regions
+
+
+BUDGET = downsample.point_budget()
+# Pilihan seri di filter -> trace
+SERIES = {'PDB Harga Konstan': 'pdb_hk', 'Y-o-Y': 'y_o_y', 'Q-to-Q': 'q_to_q'}
+# Seri -> kolom tabel pdb, untuk tombol unduh
+COLUMNS = {'pdb_hk': 'PDB_HK', 'y_o_y': 'y_o_y', 'q_to_q': 'q_to_q'}
+COLOR_CODE = "• **Color Code**: Merah=kontraksi, Biru=<3%, Hijau=sehat"
+
+
+def build_figure(height=350, budget=BUDGET, zoom=None, region=data.NATIONAL, span=None, series=tuple(SERIES)):
+    df_pdb = data.load('pdb', columns=['Period', 'Date', 'y_o_y', 'q_to_q', 'PDB_HK'], region=region)
+    national = region == data.NATIONAL
+    fig = go.Figure()
+
+    # Filter data yang valid - y-o-y kosong hanya di awal seri, jadi cukup slice (tanpa copy)
+    df_valid = data.valid_rows(df_pdb, 'y_o_y')
+    # Rentang periode dulu (binary search di Date), lalu zoom box-select di dalamnya
+    df_valid = downsample.window(df_valid, span, 'Date')
+    df_valid = downsample.downsample(downsample.window(df_valid, zoom, 'Period'), 'y_o_y', budget)
+    shown = {SERIES[name] for name in series}
+
+    # Bar chart untuk PDB Harga Konstan (background)
+    if 'pdb_hk' in shown:
+        colors = metrics.bucket(df_valid['y_o_y'], 'pdb_growth')
+        fig.add_trace(go.Bar(
+            x=df_valid['Period'],
+            y=df_valid['PDB_HK']/1000,  # Konversi ke triliun
+            name='PDB Harga Konstan (Triliun Rp)',
+            marker_color=colors,
+            opacity=0.6,
+            yaxis='y1',
+            hovertemplate='<b>%{x}</b><br>PDB HK: %{y:.0f}T Rp<extra></extra>'
+        ))
+
+    # Y-o-Y line (overlay on same x-axis)
+    if 'y_o_y' in shown:
+        fig.add_trace(go.Scatter(
+            x=df_valid['Period'],  # Pakai Period yang sama dengan bar
+            y=df_valid['y_o_y'],
+            name='Pertumbuhan Y-o-Y (%)',
+            line=dict(color='red', width=3),
+            marker=dict(size=6, color='red'),
+            yaxis='y2',
+            hovertemplate='<b>%{x}</b><br>Y-o-Y: %{y:.2f}%<extra></extra>'
+        ))
+
+    # Q-to-Q line (overlay on same x-axis)
+    if 'q_to_q' in shown:
+        fig.add_trace(go.Scatter(
+            x=df_valid['Period'],  # Pakai Period yang sama dengan bar
+            y=df_valid['q_to_q'],
+            name='Pertumbuhan Q-to-Q (%)',
+            line=dict(color='navy', width=2, dash='dot'),
+            marker=dict(size=4, color='navy'),
+            yaxis='y2',
+            hovertemplate='<b>%{x}</b><br>Q-to-Q: %{y:.2f}%<extra></extra>'
+        ))
+
+    # Add shaded areas untuk periode khusus
+    fig.add_vrect(
+        x0="2020-I", x1="2020-IV",
+        fillcolor="red", opacity=0.1,
+        line_width=0,
+    )
+    fig.add_vrect(
+        x0="2021-I", x1="2021-IV",
+        fillcolor="green", opacity=0.1,
+        line_width=0,
+    )
+
+    # Zero line reference
+    fig.add_hline(y=0, line_dash="solid", line_color="gray", line_width=1, opacity=0.5, yref='y2')
+
+    fig.update_layout(
+        title='Pertumbuhan & Skala Ekonomi ' + (regions.label('pdb', region) or 'Indonesia'),
+        xaxis_title='Periode',
+        height=height,
+        plot_bgcolor='white',
+        hovermode='x unified',
+        yaxis=dict(
+            title='PDB Harga Konstan (Triliun Rp)',
+            side='left',
+            showgrid=True,
+            gridcolor='lightgray',
+            range=[0, 6000] if national else None
+        ),
+        yaxis2=dict(
+            title='Pertumbuhan (%)',
+            side='right',
+            overlaying='y',
+            showgrid=False,
+            zeroline=True,
+            zerolinecolor='gray',
+            range=[-8, 8] if national else None
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            font=dict(size=10)
+        ),
+        margin=dict(l=50, r=50, t=30, b=40)
+    )
+
+    # Update x-axis
+    fig.update_xaxes(
+        tickangle=45,
+        tickmode='array',
+        tickvals=df_valid['Period'][::6],  # Show every 6th label
+        showgrid=True,
+        gridcolor='lightgray'
+    )
+
+    return fig
+
+
+def insight_lines(region=data.NATIONAL):
+    """Bullet analisis dari data PDB (ringkasan di-cache per versi data)."""
+    level = insights.summary('pdb', 'PDB_HK', region=region)
+    growth = insights.summary('pdb', 'y_o_y', region=region)
+    if level.latest is None or growth.latest is None:
+        return []
+    low, latest, previous = growth.low, growth.latest, growth.previous
+    lines = [f"• **Economic Scale**: PDB riil {level.first.value / 1000:,.0f}T→{level.latest.value / 1000:,.0f}T Rp "
+             f"({level.first.label}–{level.latest.label})"]
+    if low.value < 0:
+        lines.append(f"• **{low.label[:4]} Crisis**: Kontraksi terdalam {low.value:.2f}% {low.label}")
+    else:
+        lines.append(f"• **Lowest Growth**: {low.value:.2f}% {low.label}")
+    episode = growth.worst_episode()
+    if episode is not None and episode.recovered is not None:
+        recovered = episode.recovered
+        lines.append(f"• **Recovery**: Kembali ke {recovered.value:.2f}% {recovered.label}, "
+                     f"{recovered.pos - episode.end.pos} triwulan setelah palung")
+    elif episode is not None:
+        lines.append(f"• **Recovery**: Belum kembali ke {episode.start.value:.2f}% ({episode.start.label})")
+    lines.append(f"• **Recent Trend**: Rata-rata {growth.mean:.2f}% dalam {len(growth.tail)} triwulan terakhir, "
+                 f"tren {growth.slope * 4:+.2f} pp/tahun")
+    if previous is not None:
+        lines.append(f"• **Latest**: {latest.value:.2f}% {latest.label} "
+                     f"({growth.delta:+.2f} pp dari {previous.label})")
+    return lines
+
+
+def figure(region=data.NATIONAL, zoom=None, span=None, series=tuple(SERIES)):
+    return figures.get_figure('Neraca Nasional', 'pertumbuhan', data.data_version('pdb', region),
+                              build_figure, height=350, budget=BUDGET, zoom=zoom, region=region,
+                              span=span, series=series)
+
+
+def content(region=data.NATIONAL):
+    """Figure dan bullet insight tab ini (dipakai ``dashboard.prebuild`` dan ``dashboard.snapshot``)."""
+    return [figure(region)], [*insight_lines(region), COLOR_CODE]
+
+
+@st.fragment
+def chart_section(region):
+    """Filter dan chart; interaksi di sini hanya menjalankan ulang fragment ini."""
+    with instrumentation.fragment('neraca_nasional'):
+        df_pdb = data.valid_rows(data.load('pdb', columns=['Period', 'Date', 'y_o_y'], region=region), 'y_o_y')
+        range_col, series_col = st.columns([2, 1])
+        with range_col:
+            span = charts.period_range(df_pdb, key=f'pdb_periode_{region}')
+        with series_col:
+            series = st.multiselect('Seri', list(SERIES), default=list(SERIES), key='pdb_seri')
+        # Zoom lewat box-select hanya aktif kalau seri perlu di-downsample
+        n_rows = len(downsample.window(df_pdb, span, 'Date'))
+        zoom_key = f'pdb_chart_{region}' if downsample.needed(n_rows, BUDGET) else None
+        fig = figure(region, zoom=charts.zoom_selection(zoom_key), span=span, series=tuple(series))
+        charts.plotly_chart(fig, zoom_key=zoom_key)
+        if series:
+            columns = ['Period', 'Date', *(COLUMNS[SERIES[name]] for name in series)]
+            export.indicator_buttons('pdb', region, span, columns)
+
+
+def render():
+    # Create single combined chart
+    chart_col, insight_col = st.columns([2.5, 1])
+    
+    with chart_col:
+        region = regions.picker('pdb', key='neraca_wilayah')
+        chart_section(region)
+        
+    with insight_col:
+        st.markdown('<div class="insight-section">', unsafe_allow_html=True)
+        st.markdown("#### Analysis:")
+        for line in insight_lines(region):
+            st.markdown(line)
+        st.markdown(COLOR_CODE)
+        st.markdown('</div>', unsafe_allow_html=True)
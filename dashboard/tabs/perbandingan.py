@@ -0,0 +1,158 @@
+import itertools
+from functools import partial
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from dashboard import charts, data, export, figures, periods
+
+# Frekuensi asli tiap indikator
+FREQUENCY = {'pdb': 'triwulan', 'kemiskinan': 'semester', 'ipm': 'tahunan'}
+# Label -> (indikator, kolom, satuan hover)
+SERIES = {
+    'Pertumbuhan PDB y-o-y (%)': ('pdb', 'y_o_y', '%'),
+    'Pertumbuhan PDB q-to-q (%)': ('pdb', 'q_to_q', '%'),
+    'PDB Harga Konstan (Miliar Rp)': ('pdb', 'PDB_HK', ''),
+    'Deflator PDB': ('pdb', 'deflator', ''),
+    'Persentase Penduduk Miskin (%)': ('kemiskinan', 'Persentase_Miskin', '%'),
+    'Jumlah Penduduk Miskin (Juta)': ('kemiskinan', 'Jumlah_Miskin', ''),
+    'Gini Ratio': ('kemiskinan', 'Gini_Ratio', ''),
+    'IPM Rata-rata': ('ipm', 'IPM_Total', ''),
+    'Gender Gap IPM': ('ipm', 'Gender_Gap', ''),
+}
+AGGREGATIONS = {'Rata-rata': 'mean', 'Akhir periode': 'last'}
+DEFAULT_PAIR = ('Pertumbuhan PDB y-o-y (%)', 'Persentase Penduduk Miskin (%)')
+
+
+def series(label):
+    """Seri ``label`` ber-index ``PeriodIndex`` pada frekuensi aslinya."""
+    name, column, _ = SERIES[label]
+    df = data.load(name, columns=[*periods.SOURCE_KEYS[FREQUENCY[name]], column])
+    return df[column].set_axis(periods.period_index(df)).rename(label)
+
+
+def native_frequency(label):
+    return FREQUENCY[SERIES[label][0]]
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _panel(a, b, kind, how, version_a, version_b):
+    return periods.align(series(a), series(b), kind, how)
+
+
+def panel(a, b, kind, how='mean'):
+    """Panel dua seri pada frekuensi ``kind`` (di-cache per versi data kedua indikator)."""
+    return _panel(a, b, kind, how, data.data_version(SERIES[a][0]), data.data_version(SERIES[b][0]))
+
+
+def build_figure(a, b, kind, how='mean', height=380):
+    df = panel(a, b, kind, how)
+    dates = df.index.start_time
+    period_labels = periods.labels(df.index)
+    fig = go.Figure()
+
+    for label, color, axis in ((a, '#1f77b4', 'y'), (b, '#d62728', 'y2')):
+        unit = SERIES[label][2]
+        fig.add_trace(go.Scatter(
+            x=dates,
+            y=df[label],
+            name=label,
+            yaxis=axis,
+            mode='lines+markers',
+            line=dict(color=color, width=2),
+            marker=dict(size=5, color=color),
+            # Seri yang lebih jarang punya periode kosong di panel gabungan
+            connectgaps=True,
+            customdata=period_labels,
+            hovertemplate=f'<b>%{{customdata}}</b><br>{label}: %{{y:.2f}}{unit}<extra></extra>'
+        ))
+
+    fig.update_layout(
+        title=f'{a} vs {b} ({kind})',
+        height=height,
+        plot_bgcolor='white',
+        hovermode='x unified',
+        xaxis=dict(title='Periode', showgrid=True, gridcolor='lightgray'),
+        yaxis=dict(title=dict(text=a, font=dict(color='#1f77b4')), showgrid=True, gridcolor='lightgray'),
+        yaxis2=dict(title=dict(text=b, font=dict(color='#d62728')), overlaying='y', side='right',
+                    showgrid=False),
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1, font=dict(size=10)),
+        margin=dict(l=50, r=50, t=80, b=40)
+    )
+    return fig
+
+
+def insight_lines(a, b, kind, how='mean'):
+    df = panel(a, b, kind, how).dropna()
+    if len(df) < 3:
+        return [f"• **Periode bersama**: {len(df)} periode {kind}, terlalu sedikit untuk korelasi"]
+    first, last = periods.labels(df.index[[0, -1]])
+    corr = df[a].corr(df[b])
+    strength = 'kuat' if abs(corr) >= 0.7 else 'sedang' if abs(corr) >= 0.4 else 'lemah'
+    direction = 'searah' if corr >= 0 else 'berlawanan arah'
+    return [
+        f"• **Periode bersama**: {len(df)} periode {kind} ({first}–{last})",
+        f"• **Korelasi**: {corr:+.2f} ({strength}, {direction})",
+    ]
+
+
+def table(a, b, kind, how='mean'):
+    """Panel ``a``/``b`` sebagai tabel datar (kolom ``Period``, ``Date``) untuk diunduh."""
+    df = panel(a, b, kind, how)
+    return df.reset_index(drop=True).assign(Period=periods.labels(df.index, kind), Date=df.index.start_time)[
+        ['Period', 'Date', a, b]]
+
+
+def figure(a, b, kind, how='mean'):
+    name_a, name_b = SERIES[a][0], SERIES[b][0]
+    version = (data.data_version(name_a), data.data_version(name_b))
+    # Nama chart memuat indikatornya supaya versi baru hanya membuang pasangan yang sama
+    return figures.get_figure('Perbandingan', f'overlay_{name_a}_{name_b}', version, build_figure,
+                              a=a, b=b, kind=kind, how=how, height=380)
+
+
+def content(region=data.NATIONAL):
+    """Figure dan bullet insight pasangan default (dipakai ``dashboard.snapshot``)."""
+    a, b = DEFAULT_PAIR
+    kind = periods.coarser(native_frequency(a), native_frequency(b))
+    return [figure(a, b, kind)], insight_lines(a, b, kind)
+
+
+def warm(region=data.NATIONAL):
+    """Overlay semua pasangan seri pada frekuensi default (untuk ``dashboard.prebuild``)."""
+    if region != data.NATIONAL:
+        return
+    for a, b in itertools.permutations(SERIES, 2):
+        figure(a, b, periods.coarser(native_frequency(a), native_frequency(b)))
+
+
+def render():
+    labels = list(SERIES)
+    left, right, freq_col, how_col = st.columns([1.5, 1.5, 1, 1])
+    with left:
+        a = st.selectbox('Indikator 1', labels, index=labels.index(DEFAULT_PAIR[0]), key='perbandingan_a')
+    with right:
+        b = st.selectbox('Indikator 2', labels, index=labels.index(DEFAULT_PAIR[1]), key='perbandingan_b')
+    kinds = list(periods.FREQS)
+    default = periods.coarser(native_frequency(a), native_frequency(b))
+    with freq_col:
+        kind = st.selectbox('Frekuensi', kinds, index=kinds.index(default), key=f'perbandingan_freq_{a}_{b}')
+    with how_col:
+        how = AGGREGATIONS[st.selectbox('Agregasi', list(AGGREGATIONS), key='perbandingan_agg')]
+
+    chart_col, insight_col = st.columns([2.5, 1])
+    with chart_col:
+        if a == b:
+            st.info('Pilih dua indikator yang berbeda.')
+            return
+        charts.plotly_chart(figure(a, b, kind, how))
+        versions = (data.data_version(SERIES[a][0]), data.data_version(SERIES[b][0]))
+        export.buttons(f'perbandingan_{kind}', (a, b, kind, how, versions),
+                       partial(table, a, b, kind, how), 'export_perbandingan', len(panel(a, b, kind, how)))
+
+    with insight_col:
+        st.markdown('<div class="insight-section">', unsafe_allow_html=True)
+        st.markdown("#### Insights:")
+        for line in insight_lines(a, b, kind, how):
+            st.markdown(line)
+        st.markdown('</div>', unsafe_allow_html=True)
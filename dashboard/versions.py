@@ -0,0 +1,39 @@
+"""Hash isi file dan versi kode untuk key cache, tanpa dependensi berat.
+
+Modul ini hanya memakai library standar supaya bisa di-import di jalur start
+app (mis. ``dashboard.assets``) tanpa ikut memuat pandas.
+"""
+import functools
+import hashlib
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+ROOT_DIR = PACKAGE_DIR.parent
+
+# Hash file disimpan per (mtime, size) supaya rerun tidak membaca ulang isi file
+_digest_memo = {}
+
+
+def file_digest(path):
+    path = Path(path)
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    digest = _digest_memo.get(key)
+    if digest is None:
+        digest = hashlib.sha1(path.read_bytes()).hexdigest()
+        _digest_memo[key] = digest
+    return digest
+
+
+@functools.cache
+def code_version():
+    """Hash gabungan semua modul ``dashboard/`` dan ``dashboard/tabs/``.
+
+    Dipakai di key cache yang disimpan di luar proses (snapshot, cache hangat,
+    ETag API), karena figure dan insight satu tab bergantung pada modul
+    bersama (``figures``, ``insights``, ``payload``, ``data``, ...). Dihitung
+    sekali per proses: kode yang sedang jalan adalah kode saat proses mulai.
+    """
+    files = sorted(PACKAGE_DIR.glob('*.py')) + sorted((PACKAGE_DIR / 'tabs').glob('*.py'))
+    parts = ''.join(f'{path.relative_to(PACKAGE_DIR).as_posix()}:{file_digest(path)}\n' for path in files)
+    return hashlib.sha1(parts.encode()).hexdigest()
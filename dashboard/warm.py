@@ -0,0 +1,86 @@
+"""Cache hangat di disk: figure dan ringkasan insight hasil ``dashboard.prebuild``.
+
+Satu file per entri, nama file dari hash key cache plus versi kode dashboard
+(key sudah memuat versi data), jadi entri yang dibangun dari data lama atau
+kode lama tidak pernah cocok. File yang gagal dibaca dianggap miss. Figure disimpan sebagai
+JSON Plotly yang sudah diringkas. Ringkasan insight disimpan dengan pickle,
+karena file ini hanya ditulis oleh langkah prebuild di mesin deploy sendiri.
+App membaca direktori ini di setiap cache miss figure atau insight sebelum
+membangun sendiri. Instance yang baru di-deploy langsung melayani kunjungan
+pertama dari disk.
+"""
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+from dashboard import data, versions
+
+WARM_DIR = Path(os.environ.get('DASHBOARD_WARM_DIR', data.ROOT_DIR / 'warm'))
+FIGURES = 'figures'
+SUMMARIES = 'summaries'
+
+# Direktori tujuan tulis; hanya diisi di proses prebuild
+_write_dir = None
+
+
+def enable_writes(warm_dir):
+    """Simpan setiap figure/ringkasan yang dibangun proses ini ke ``warm_dir``.
+
+    Proses prebuild selalu membangun ulang, cache hangat lama tidak dibaca.
+    """
+    global _write_dir
+    _write_dir = Path(warm_dir)
+
+
+def _path(warm_dir, kind, key):
+    # Versi kode ikut di-hash: figure/insight bergantung pada modul figures, payload, insights, ...
+    digest = hashlib.sha1(repr((versions.code_version(), key)).encode()).hexdigest()
+    return Path(warm_dir) / kind / f'{digest}.{"json" if kind == FIGURES else "pkl"}'
+
+
+def _read(kind, key):
+    if _write_dir is not None:
+        return None
+    try:
+        return _path(WARM_DIR, kind, key).read_bytes()
+    except OSError:
+        return None
+
+
+def _write(kind, key, payload):
+    if _write_dir is None:
+        return
+    path = _path(_write_dir, kind, key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+
+def load_figure(key):
+    """JSON figure untuk key cache ``key``, atau None."""
+    payload = _read(FIGURES, key)
+    try:
+        return payload.decode() if payload is not None else None
+    except UnicodeDecodeError:
+        return None
+
+
+def save_figure(key, text):
+    _write(FIGURES, key, text.encode())
+
+
+def load_summary(key):
+    payload = _read(SUMMARIES, key)
+    if payload is None:
+        return None
+    try:
+        return pickle.loads(payload)
+    except Exception:
+        # File rusak atau layout kelas SeriesSummary sudah berubah: bangun ulang
+        return None
+
+
+def save_summary(key, summary):
+    _write(SUMMARIES, key, pickle.dumps(summary, protocol=pickle.HIGHEST_PROTOCOL))